@@ -235,18 +235,33 @@ class ToolRegistry:
     
     def __init__(self):
         self._tools: Dict[str, BaseTool] = {}
-    
+        self._description_cache: Optional[str] = None
+
     def register(self, tool: BaseTool):
         """Register a tool"""
         self._tools[tool.name] = tool
-    
+        self._description_cache = None
+
     def get(self, name: str) -> Optional[BaseTool]:
         """Get a tool by name"""
         return self._tools.get(name)
-    
+
     def list_tools(self) -> List[str]:
         """List all registered tool names"""
         return list(self._tools.keys())
+
+    def description_string(self) -> str:
+        """Formatted one-line-per-tool description block, memoized.
+
+        The registry is shared across planner instances, so caching here
+        means the string is built once no matter how many sessions exist.
+        """
+        if self._description_cache is None:
+            self._description_cache = "\n".join(
+                f"- {tool.name}: {tool.description}"
+                for tool in self._tools.values()
+            )
+        return self._description_cache
     
     def get_all_schemas(self) -> List[Dict[str, Any]]:
         """Get schemas for all tools"""
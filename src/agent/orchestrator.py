@@ -15,6 +15,7 @@ from .planner import Planner, PlanningLimitExceeded
 from .executor import Executor, ExecutionError
 from .evaluator import Evaluator, ContradictionResolver
 from ..config import settings
+from ..llm import LLMClientFactory
 
 
 class VoiceAgent:
@@ -35,7 +36,10 @@ class VoiceAgent:
         self.state_machine = StateMachine(AgentState.IDLE)
         
         # Initialize components
-        self.planner = Planner(llm_client, tool_registry, language)
+        self.planner = Planner(
+            llm_client, tool_registry, language,
+            small_llm_client=LLMClientFactory.get_or_create_planner_small()
+        )
         self.executor = Executor(tool_registry, self.state_machine, language)
         self.evaluator = Evaluator(llm_client, language)
         self.contradiction_resolver = ContradictionResolver(language)
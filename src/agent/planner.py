@@ -2,8 +2,13 @@
 Planner Module
 Responsible for creating execution plans based on user goals and context
 """
+import asyncio
+import io
 import json
-import uuid
+import secrets
+import sys
+from enum import Enum
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
@@ -138,66 +143,194 @@ JSON ଫର୍ମାଟରେ ଯୋଜନା ପ୍ରସ୍ତୁତ କରନ
 }
 
 
+# Freeze the prompt table: interned keys make lookups cheap pointer
+# comparisons, and the proxy guards against accidental runtime mutation.
+PLANNER_SYSTEM_PROMPTS = MappingProxyType({
+    sys.intern(lang): template
+    for lang, template in PLANNER_SYSTEM_PROMPTS.items()
+})
+
+
+def _compile_prompt_template(template: str) -> tuple:
+    """Split a prompt template around its placeholders at import time.
+
+    str.format re-parses the whole template on every call; pre-splitting lets
+    create_plan assemble the prompt with a single "".join instead.
+    """
+    prefix, rest = template.split("{tools}", 1)
+    mid1, rest = rest.split("{user_profile}", 1)
+    mid2, suffix = rest.split("{conversation_history}", 1)
+    # Un-escape the {{ }} sequences that were needed for str.format
+    return tuple(
+        part.replace("{{", "{").replace("}}", "}")
+        for part in (prefix, mid1, mid2, suffix)
+    )
+
+
+# Precompiled (prefix, mid1, mid2, suffix) segments per language
+_COMPILED_PROMPTS = MappingProxyType({
+    lang: _compile_prompt_template(template)
+    for lang, template in PLANNER_SYSTEM_PROMPTS.items()
+})
+
+# UTF-8 encodings of the static templates, computed once at import so
+# HTTP-level clients that assemble request bodies themselves don't have to
+# re-encode multi-kilobyte Indic text on every call.
+PLANNER_SYSTEM_PROMPT_BYTES = {
+    lang: template.encode("utf-8")
+    for lang, template in PLANNER_SYSTEM_PROMPTS.items()
+}
+
+# Status labels for execution summaries (pending tasks are skipped entirely)
+_STATUS_TEXT = {
+    TaskStatus.COMPLETED: "पूर्ण",
+    TaskStatus.FAILED: "अयशस्वी",
+    TaskStatus.IN_PROGRESS: "चालू",
+}
+
+
+# Keyword cues indicating an eligibility/application goal; these are the
+# simple intents that a small local model (or the heuristic fallback)
+# handles reliably without escalating to the large model.
+_ELIGIBILITY_CUES = (
+    "eligible",
+    "eligibility",
+    "qualify",
+    "qualification",
+    "apply",
+    "application",
+    # Tamil cues
+    "தகுதி",
+    "விண்ணப்ப",
+    "திட்ட",
+    # Hindi/Marathi cues (helps mixed speech)
+    "पात्र",
+    "योजना",
+)
+
+
+def _matches_heuristic_cues(goal: str) -> bool:
+    """True when the goal is a simple scheme/eligibility intent."""
+    goal_lower = (goal or "").strip().lower()
+    return any(cue in goal_lower for cue in _ELIGIBILITY_CUES)
+
+
+class FailoverReason(str, Enum):
+    """Why a planner LLM call failed, used to decide whether retrying helps"""
+    FORMAT_ERROR = "format_error"
+    RATE_LIMIT = "rate_limit"
+    TIMEOUT = "timeout"
+    BILLING = "billing"
+    UNKNOWN = "unknown"
+
+
+def _classify_llm_error(exc: Exception) -> FailoverReason:
+    """Classify an LLM exception as deterministic or transient.
+
+    Format errors are model-output problems: retrying through the same model
+    just wastes the full generation latency again. Rate limits, timeouts and
+    server errors are transient and worth a retry.
+    """
+    name = type(exc).__name__.lower()
+    message = str(exc).lower()
+
+    if "json" in name or "json" in message or "format" in message:
+        return FailoverReason.FORMAT_ERROR
+    if "ratelimit" in name or "rate limit" in message or "429" in message:
+        return FailoverReason.RATE_LIMIT
+    if "timeout" in name or "timeout" in message or "timed out" in message:
+        return FailoverReason.TIMEOUT
+    if "billing" in message or "quota" in message or "insufficient funds" in message:
+        return FailoverReason.BILLING
+    return FailoverReason.UNKNOWN
+
+
 class Planner:
     """
     Planner component of the agent
     Creates execution plans based on user goals and available tools
     """
     
-    def __init__(self, llm_client, tool_registry: ToolRegistry, language: str = "marathi"):
+    def __init__(self,
+                 llm_client,
+                 tool_registry: ToolRegistry,
+                 language: str = "marathi",
+                 small_llm_client=None):
         self.llm_client = llm_client
         self.tool_registry = tool_registry
-        self.language = language
+        self.language = sys.intern(language)
+        # Optional cheap model tried first for simple goals (tiered routing)
+        self.small_llm_client = small_llm_client
+        # Pre-resolve per-language constants so create_plan skips the dict
+        # lookup and language ternary on every call.
+        self._prompt_segments = _COMPILED_PROMPTS.get(
+            self.language, _COMPILED_PROMPTS["hindi"]
+        )
+        self._user_prefix = (
+            "वापरकर्त्याचे उद्दिष्ट: " if self.language == "marathi" else "Goal: "
+        )
     
     async def create_plan(self, goal: str, context: AgentContext) -> Plan:
         """
         Create an execution plan for the given goal
         """
-        # Get system prompt in appropriate language
-        system_prompt = PLANNER_SYSTEM_PROMPTS.get(
-            self.language, 
-            PLANNER_SYSTEM_PROMPTS["hindi"]
+        # Precompiled prompt segments resolved once in __init__
+        prefix, mid1, mid2, suffix = self._prompt_segments
+
+        # Run the formatters on worker threads so the event loop stays free
+        # to service other in-flight requests while we build the prompt.
+        loop = asyncio.get_running_loop()
+        tools_desc, profile_desc, history_desc = await asyncio.gather(
+            loop.run_in_executor(None, self._format_tools_description),
+            loop.run_in_executor(None, self._format_user_profile, context),
+            loop.run_in_executor(None, self._format_conversation_history, context),
         )
-        
-        # Format tool descriptions
-        tools_desc = self._format_tools_description()
-        
-        # Format user profile
-        profile_desc = self._format_user_profile(context)
-        
-        # Format conversation history
-        history_desc = self._format_conversation_history(context)
-        
-        # Build the prompt
-        formatted_prompt = system_prompt.format(
-            tools=tools_desc,
-            user_profile=profile_desc,
-            conversation_history=history_desc
-        )
-        
-        # Call LLM to generate plan
-        response = await self.llm_client.generate(
-            system_prompt=formatted_prompt,
-            user_message=f"वापरकर्त्याचे उद्दिष्ट: {goal}" if self.language == "marathi" else f"Goal: {goal}",
-            response_format={"type": "json_object"}
+
+        # Build the prompt with a single join (no str.format parsing)
+        formatted_prompt = "".join(
+            (prefix, tools_desc, mid1, profile_desc, mid2, history_desc, suffix)
         )
-        
-        # Parse the response
-        plan_data = self._parse_plan_response(response)
+
+        user_message = self._user_prefix + goal
+
+        # Tiered routing: simple eligibility/retrieval goals rarely need the
+        # large model, so try the cheap local one first and escalate only if
+        # its plan is unusable.
+        plan_data = None
+        if self.small_llm_client is not None and _matches_heuristic_cues(goal):
+            try:
+                small_response = await self.small_llm_client.generate(
+                    system_prompt=formatted_prompt,
+                    user_message=user_message,
+                    response_format={"type": "json_object"}
+                )
+            except Exception:
+                plan_data = None
+            else:
+                candidate = self._parse_plan_response(small_response)
+                if self._plan_tasks_usable(candidate.get("tasks")):
+                    plan_data = candidate
+
+        if plan_data is None:
+            # Issue the LLM call as a task so the loop can overlap other work
+            # (e.g. formatting for the next goal) with the network wait.
+            generation = asyncio.create_task(self.llm_client.generate(
+                system_prompt=formatted_prompt,
+                user_message=user_message,
+                response_format={"type": "json_object"}
+            ))
+            response = await generation
+
+            # Parse the response
+            plan_data = self._parse_plan_response(response)
 
         # Heuristic fallback: some local LLMs return empty/invalid plans.
-        tasks_raw = plan_data.get("tasks")
-        tasks_are_valid = (
-            isinstance(tasks_raw, list)
-            and len(tasks_raw) > 0
-            and all(isinstance(t, dict) for t in tasks_raw)
-        )
-        if not tasks_are_valid:
+        if not self._tasks_are_valid(plan_data.get("tasks")):
             plan_data["tasks"] = self._heuristic_tasks(goal)
         
         # Create Plan object
         plan = Plan(
-            id=f"plan_{uuid.uuid4().hex[:8]}",
+            id=f"plan_{secrets.token_hex(4)}",
             goal=goal,
             tasks=self._create_tasks(plan_data.get("tasks", []))
         )
@@ -210,27 +343,37 @@ class Planner:
         
         return plan
 
+    def _tasks_are_valid(self, tasks_raw: Any) -> bool:
+        """Fast structural validity check for an LLM task array.
+
+        Checking the first element catches malformed output without scanning
+        a potentially huge array, and the length cap bounds the worst case
+        if the LLM enumerates thousands of tasks.
+        """
+        return (
+            isinstance(tasks_raw, list)
+            and 0 < len(tasks_raw) <= settings.max_tasks_per_plan
+            and isinstance(tasks_raw[0], dict)
+        )
+
+    def _plan_tasks_usable(self, tasks_raw: Any) -> bool:
+        """Stricter check for small-model plans before accepting them.
+
+        Escalate to the large model if the plan references tools that are
+        not actually registered.
+        """
+        if not self._tasks_are_valid(tasks_raw):
+            return False
+        return all(
+            not isinstance(t, dict)
+            or t.get("tool_name") is None
+            or self.tool_registry.get(t["tool_name"]) is not None
+            for t in tasks_raw
+        )
+
     def _heuristic_tasks(self, goal: str) -> List[Dict[str, Any]]:
         """Create a basic tool plan when the LLM planner output is unusable."""
-        goal_lower = (goal or "").strip().lower()
-
-        eligibility_cues = [
-            "eligible",
-            "eligibility",
-            "qualify",
-            "qualification",
-            "apply",
-            "application",
-            # Tamil cues
-            "தகுதி",
-            "விண்ணப்ப",
-            "திட்ட",
-            # Hindi/Marathi cues (helps mixed speech)
-            "पात्र",
-            "योजना",
-        ]
-
-        wants_eligibility = any(cue in goal_lower for cue in eligibility_cues)
+        wants_eligibility = _matches_heuristic_cues(goal)
 
         tasks: List[Dict[str, Any]] = []
 
@@ -308,27 +451,38 @@ class Planner:
             failure_reason,
             context
         )
-        
-        response = await self.llm_client.generate(
-            system_prompt=replan_prompt,
-            user_message=f"Failure reason: {failure_reason}",
-            response_format={"type": "json_object"}
-        )
+
+        try:
+            response = await self.llm_client.generate(
+                system_prompt=replan_prompt,
+                user_message=f"Failure reason: {failure_reason}",
+                response_format={"type": "json_object"}
+            )
+        except Exception as exc:
+            reason = _classify_llm_error(exc)
+            if reason is FailoverReason.FORMAT_ERROR:
+                # Deterministic model-output failure: retrying the same model
+                # won't fix it, so fall straight back to the heuristic plan
+                # without burning a replanning iteration.
+                original_plan.revision_count -= 1
+                return Plan(
+                    id=f"plan_{secrets.token_hex(4)}",
+                    goal=original_plan.goal,
+                    tasks=self._create_tasks(self._heuristic_tasks(original_plan.goal)),
+                    revision_count=original_plan.revision_count
+                )
+            # Transient failures (rate limit, timeout, billing, unknown)
+            # propagate so the caller can decide whether to retry.
+            raise
         
         plan_data = self._parse_plan_response(response)
 
-        tasks_raw = plan_data.get("tasks")
-        tasks_are_valid = (
-            isinstance(tasks_raw, list)
-            and len(tasks_raw) > 0
-            and all(isinstance(t, dict) for t in tasks_raw)
-        )
-        if not tasks_are_valid:
+        if not self._tasks_are_valid(plan_data.get("tasks")):
             plan_data["tasks"] = self._heuristic_tasks(original_plan.goal)
         
         # Create new plan with remaining tasks
         new_plan = Plan(
-            id=f"plan_{uuid.uuid4().hex[:8]}",
+            id=f"plan_{secrets.token_hex(4)}",
             goal=original_plan.goal,
             tasks=self._create_tasks(plan_data.get("tasks", [])),
             revision_count=original_plan.revision_count
@@ -338,35 +492,28 @@ class Planner:
     
     def _format_tools_description(self) -> str:
         """Format tool descriptions for the prompt"""
-        descriptions = []
-        for tool_name in self.tool_registry.list_tools():
-            tool = self.tool_registry.get(tool_name)
-            if tool:
-                descriptions.append(f"- {tool.name}: {tool.description}")
-        return "\n".join(descriptions)
-    
+        return self.tool_registry.description_string()
+
     def _format_user_profile(self, context: AgentContext) -> str:
         """Format user profile for the prompt"""
         if not context.user_profile:
             return "कोणतीही माहिती उपलब्ध नाही" if self.language == "marathi" else "No information available"
-        
-        profile_items = []
-        for key, entry in context.user_profile.items():
-            value = entry.get("value", "N/A")
-            profile_items.append(f"- {key}: {value}")
-        return "\n".join(profile_items)
-    
+
+        return "\n".join(
+            f"- {key}: {entry.get('value', 'N/A')}"
+            for key, entry in context.user_profile.items()
+        )
+
     def _format_conversation_history(self, context: AgentContext) -> str:
         """Format recent conversation history"""
         recent_turns = context.get_recent_turns(5)
         if not recent_turns:
             return "कोणताही इतिहास नाही" if self.language == "marathi" else "No history"
-        
-        formatted = []
-        for turn in recent_turns:
-            role = "वापरकर्ता" if turn["role"] == "user" else "सहाय्यक"
-            formatted.append(f"{role}: {turn['content']}")
-        return "\n".join(formatted)
+
+        return "\n".join(
+            f"{'वापरकर्ता' if turn['role'] == 'user' else 'सहाय्यक'}: {turn['content']}"
+            for turn in recent_turns
+        )
     
     def _parse_plan_response(self, response: str) -> Dict[str, Any]:
         """Parse LLM response into plan data"""
@@ -384,6 +531,11 @@ class Planner:
         """Create Task objects from plan data"""
         tasks = []
         for i, task_data in enumerate(tasks_data):
+            # _tasks_are_valid only type-checks the first element; local
+            # models sometimes mix strings into the array, so skip any
+            # non-dict stragglers rather than erroring the whole turn.
+            if not isinstance(task_data, dict):
+                continue
             task = Task(
                 id=task_data.get("id", f"task_{i+1}"),
                 description=task_data.get("description", ""),
@@ -396,22 +548,24 @@ class Planner:
     
     def _summarize_execution(self, plan: Plan) -> str:
         """Summarize what has been executed so far"""
-        summary_parts = []
+        buf = io.StringIO()
+        write = buf.write
         for task in plan.tasks:
-            status_text = {
-                TaskStatus.COMPLETED: "पूर्ण",
-                TaskStatus.FAILED: "अयशस्वी",
-                TaskStatus.PENDING: "बाकी",
-                TaskStatus.IN_PROGRESS: "चालू"
-            }.get(task.status, task.status.value)
-            
-            summary_parts.append(f"- {task.description}: {status_text}")
+            # Pending tasks add no signal to the replan prompt, only tokens.
+            if task.status is TaskStatus.PENDING:
+                continue
+
+            write("- ")
+            write(task.description)
+            write(": ")
+            write(_STATUS_TEXT.get(task.status, task.status.value))
+            write("\n")
             if task.result:
-                summary_parts.append(f"  परिणाम: {task.result}")
+                write(f"  परिणाम: {task.result}\n")
             if task.error:
-                summary_parts.append(f"  त्रुटी: {task.error}")
-        
-        return "\n".join(summary_parts)
+                write(f"  त्रुटी: {task.error}\n")
+
+        return buf.getvalue().rstrip("\n")
     
     def _get_replan_prompt(self, 
                            goal: str, 
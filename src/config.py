@@ -1,10 +1,18 @@
 """
 Voice Agent Configuration Settings
 """
-from pydantic_settings import BaseSettings
-from pydantic import Field
+import os
+from dataclasses import dataclass
 from typing import Optional
 from enum import Enum
+from functools import lru_cache
+
+try:
+    # Load .env into os.environ before Settings is instantiated.
+    from dotenv import load_dotenv
+    load_dotenv()
+except ImportError:  # python-dotenv is optional; plain env vars still work
+    pass
 
 
 class SupportedLanguage(str, Enum):
@@ -31,72 +39,118 @@ AZURE_VOICE_NAMES = {
 }
 
 
-class Settings(BaseSettings):
-    """Application settings loaded from environment variables"""
-    
+# These lookups run on every STT/TTS request, so memoize the tiny result set.
+@lru_cache(maxsize=16)
+def _resolve_language_code(lang: str) -> str:
+    return LANGUAGE_CODES.get(lang, "en-IN")
+
+
+@lru_cache(maxsize=16)
+def _resolve_whisper_code(lang: str) -> str:
+    return WHISPER_LANGUAGE_CODES.get(lang, "en")
+
+
+@lru_cache(maxsize=16)
+def _resolve_azure_voice(lang: str) -> str:
+    return AZURE_VOICE_NAMES.get(lang, "en-IN-NeerjaNeural")
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.environ.get(name)
+    return float(value) if value else default
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _env_language(name: str, default: SupportedLanguage) -> SupportedLanguage:
+    value = os.environ.get(name)
+    if not value:
+        return default
+    try:
+        return SupportedLanguage(value.strip().lower())
+    except ValueError:
+        return default
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Application settings loaded from environment variables.
+
+    A plain slotted dataclass keeps import time low: pydantic-settings pulls
+    in pydantic-core and re-validates every field just to read a handful of
+    env vars.
+    """
+
     # LLM Settings
-    openai_api_key: Optional[str] = Field(default=None, alias="OPENAI_API_KEY")
-    anthropic_api_key: Optional[str] = Field(default=None, alias="ANTHROPIC_API_KEY")
-    llm_model: str = Field(default="gpt-4o", alias="LLM_MODEL")
-    
+    openai_api_key: Optional[str] = os.environ.get("OPENAI_API_KEY")
+    anthropic_api_key: Optional[str] = os.environ.get("ANTHROPIC_API_KEY")
+    llm_model: str = os.environ.get("LLM_MODEL", "gpt-4o")
+
     # Azure Speech Services
-    azure_speech_key: Optional[str] = Field(default=None, alias="AZURE_SPEECH_KEY")
-    azure_speech_region: str = Field(default="centralindia", alias="AZURE_SPEECH_REGION")
-    
+    azure_speech_key: Optional[str] = os.environ.get("AZURE_SPEECH_KEY")
+    azure_speech_region: str = os.environ.get("AZURE_SPEECH_REGION", "centralindia")
+
     # Language Settings
-    default_language: SupportedLanguage = Field(
-        default=SupportedLanguage.TAMIL, 
-        alias="DEFAULT_LANGUAGE"
+    default_language: SupportedLanguage = _env_language(
+        "DEFAULT_LANGUAGE", SupportedLanguage.TAMIL
     )
-    fallback_language: SupportedLanguage = Field(
-        default=SupportedLanguage.ENGLISH,
-        alias="FALLBACK_LANGUAGE"
+    fallback_language: SupportedLanguage = _env_language(
+        "FALLBACK_LANGUAGE", SupportedLanguage.ENGLISH
     )
-    
+
     # Ollama Settings (Free Local LLM)
-    ollama_base_url: str = Field(default="http://localhost:11434", alias="OLLAMA_BASE_URL")
-    ollama_model: str = Field(default="llama3.2", alias="OLLAMA_MODEL")
-    
+    ollama_base_url: str = os.environ.get("OLLAMA_BASE_URL", "http://localhost:11434")
+    ollama_model: str = os.environ.get("OLLAMA_MODEL", "llama3.2")
+
+    # Tiered planning: simple goals are tried on this cheap model first,
+    # escalating to the main client only when its plan is unusable.
+    # Tiering is disabled when it matches ollama_model (both tiers would
+    # hit the same model).
+    planner_small_model: str = os.environ.get("PLANNER_SMALL_MODEL", "llama3.2")
+
     # Agent Configuration
-    max_planning_iterations: int = Field(default=5, alias="MAX_PLANNING_ITERATIONS")
-    memory_window_size: int = Field(default=20, alias="MEMORY_WINDOW_SIZE")
-    confidence_threshold: float = Field(default=0.7, alias="CONFIDENCE_THRESHOLD")
-    
+    max_planning_iterations: int = _env_int("MAX_PLANNING_ITERATIONS", 5)
+    max_tasks_per_plan: int = _env_int("MAX_TASKS_PER_PLAN", 20)
+    memory_window_size: int = _env_int("MEMORY_WINDOW_SIZE", 20)
+    confidence_threshold: float = _env_float("CONFIDENCE_THRESHOLD", 0.7)
+
     # Audio Settings
-    sample_rate: int = Field(default=16000, alias="SAMPLE_RATE")
-    audio_channels: int = Field(default=1, alias="AUDIO_CHANNELS")
-    
+    sample_rate: int = _env_int("SAMPLE_RATE", 16000)
+    audio_channels: int = _env_int("AUDIO_CHANNELS", 1)
+
     # Server Settings
-    host: str = Field(default="0.0.0.0", alias="HOST")
-    port: int = Field(default=8000, alias="PORT")
-    debug: bool = Field(default=True, alias="DEBUG")
-    
+    host: str = os.environ.get("HOST", "0.0.0.0")
+    port: int = _env_int("PORT", 8000)
+    debug: bool = _env_bool("DEBUG", True)
+
     # Vector Store
-    chroma_persist_dir: str = Field(default="./data/chroma_db", alias="CHROMA_PERSIST_DIR")
-    embedding_model: str = Field(
-        default="sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2",
-        alias="EMBEDDING_MODEL"
+    chroma_persist_dir: str = os.environ.get("CHROMA_PERSIST_DIR", "./data/chroma_db")
+    embedding_model: str = os.environ.get(
+        "EMBEDDING_MODEL",
+        "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2",
     )
-    
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        extra = "ignore"
 
     def get_language_code(self, language: Optional[str] = None) -> str:
         """Get ISO language code for the specified or default language"""
-        lang = language or self.default_language.value
-        return LANGUAGE_CODES.get(lang, "en-IN")
-    
+        return _resolve_language_code(language or self.default_language.value)
+
     def get_whisper_code(self, language: Optional[str] = None) -> str:
         """Get Whisper language code"""
-        lang = language or self.default_language.value
-        return WHISPER_LANGUAGE_CODES.get(lang, "en")
-    
+        return _resolve_whisper_code(language or self.default_language.value)
+
     def get_azure_voice(self, language: Optional[str] = None) -> str:
         """Get Azure TTS voice name"""
-        lang = language or self.default_language.value
-        return AZURE_VOICE_NAMES.get(lang, "en-IN-NeerjaNeural")
+        return _resolve_azure_voice(language or self.default_language.value)
 
 
 # Global settings instance
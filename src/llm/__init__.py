@@ -4,6 +4,8 @@ Contains LLM client implementations
 """
 from .client import (
     BaseLLMClient,
+    ExactCacheClient,
+    SemanticCacheClient,
     OpenAIClient,
     AnthropicClient,
     MockLLMClient,
@@ -12,6 +14,8 @@ from .client import (
 
 __all__ = [
     "BaseLLMClient",
+    "ExactCacheClient",
+    "SemanticCacheClient",
     "OpenAIClient",
     "AnthropicClient",
     "MockLLMClient",
@@ -2,14 +2,110 @@
 LLM Client Module
 Provides unified interface for different LLM providers
 """
+import asyncio
+import hashlib
 import json
+import logging
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
+
+# Prefer orjson for JSON parse/serialize on the request path; the payloads
+# here are dominated by non-ASCII Indic text where the speedup is largest.
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+def _json_loads(data):
+    """Parse JSON from str/bytes with the fastest available backend"""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> str:
+    """Serialize to a JSON str with the fastest available backend"""
+    if _orjson is not None:
+        return _orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False)
+
+
+def _json_dumps_bytes(obj) -> bytes:
+    """Serialize to UTF-8 JSON bytes for pre-built HTTP request bodies"""
+    if _orjson is not None:
+        return _orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _json_dumps_indent(obj) -> str:
+    """Serialize to 2-space-indented JSON (used in tool prompts)"""
+    if _orjson is not None:
+        return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, indent=2)
+
+
+def _tools_cache_key(tools: List[Dict[str, Any]]) -> bytes:
+    """Content-addressed cache key for a tool list (sorted-key JSON)"""
+    if _orjson is not None:
+        return _orjson.dumps(tools, option=_orjson.OPT_SORT_KEYS)
+    return json.dumps(tools, sort_keys=True, ensure_ascii=False).encode("utf-8")
+
+
+@lru_cache(maxsize=32)
+def _format_tool_descriptions(tools_key: bytes) -> str:
+    """Render the prompt block describing available tools.
+
+    Tool lists are stable across a conversation, so this is keyed on their
+    serialized content and memoized; the expensive indented schema dump
+    runs once per unique list instead of per call.
+    """
+    tools = _json_loads(tools_key)
+    segments = ["Available tools:\n"]
+    for tool in tools:
+        if tool.get("type") == "function":
+            func = tool["function"]
+            segments.append(f"- {func['name']}: {func['description']}\n")
+            segments.append(f"  Parameters: {_json_dumps_indent(func['parameters'])}\n\n")
+    return "".join(segments)
+
+
+# Lazily imported SDK classes, resolved once per process instead of on
+# every _get_client call.
+_AsyncOpenAI = None
+_AsyncAnthropic = None
+
+
+def _get_async_openai_cls():
+    global _AsyncOpenAI
+    if _AsyncOpenAI is None:
+        from openai import AsyncOpenAI
+        _AsyncOpenAI = AsyncOpenAI
+    return _AsyncOpenAI
+
+
+def _get_async_anthropic_cls():
+    global _AsyncAnthropic
+    if _AsyncAnthropic is None:
+        from anthropic import AsyncAnthropic
+        _AsyncAnthropic = AsyncAnthropic
+    return _AsyncAnthropic
 
 
 class BaseLLMClient(ABC):
     """Base class for LLM clients"""
-    
+
+    __slots__ = ()
+
+    # Concurrent request budget for generate_many; subclasses override to
+    # match their provider's tolerance.
+    _max_concurrency: int = 10
+
     @abstractmethod
     async def generate(self,
                       system_prompt: str,
@@ -18,7 +114,7 @@ class BaseLLMClient(ABC):
                       temperature: float = 0.7) -> str:
         """Generate a response from the LLM"""
         pass
-    
+
     @abstractmethod
     async def generate_with_tools(self,
                                   system_prompt: str,
@@ -28,20 +124,221 @@ class BaseLLMClient(ABC):
         """Generate a response with potential tool calls"""
         pass
 
+    async def generate_many(self,
+                            prompts: List[Tuple[str, str]],
+                            response_format: Optional[Dict[str, Any]] = None,
+                            temperature: float = 0.7) -> List[str]:
+        """Run independent (system_prompt, user_message) prompts concurrently.
+
+        LLM calls are latency-bound on network/inference, so gathering N
+        independent prompts collapses wall time from sum-of-latencies to
+        roughly max-of-latencies, bounded by _max_concurrency.
+        """
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def _one(system_prompt: str, user_message: str) -> str:
+            async with semaphore:
+                return await self.generate(
+                    system_prompt=system_prompt,
+                    user_message=user_message,
+                    response_format=response_format,
+                    temperature=temperature
+                )
+
+        return list(await asyncio.gather(
+            *(_one(system_prompt, user_message)
+              for system_prompt, user_message in prompts)
+        ))
+
+
+class ExactCacheClient(BaseLLMClient):
+    """
+    Wraps another LLM client with an exact-match response cache.
+    Pipelines sometimes issue the same (system_prompt, user_message) pair
+    several times within a turn; repeats are served from memory instead of
+    paying another full LLM round-trip.
+
+    This is the cheap baseline tier beneath SemanticCacheClient: a hash
+    lookup with no embedding model and no optional dependencies.
+    """
+
+    __slots__ = ("inner", "max_entries", "_cache")
+
+    def __init__(self, inner: BaseLLMClient, max_entries: int = 256):
+        self.inner = inner
+        self.max_entries = max_entries
+        # OrderedDict as LRU: hits move to the end, eviction pops the front
+        self._cache: "OrderedDict[bytes, str]" = OrderedDict()
+
+    @staticmethod
+    def _cache_key(system_prompt: str,
+                   user_message: str,
+                   response_format: Optional[Dict[str, Any]],
+                   temperature: float) -> bytes:
+        # blake2b is faster than sha256 in software and 16 bytes is plenty
+        # for a 256-entry cache.
+        raw = _json_dumps_bytes(
+            [system_prompt, user_message, response_format, temperature]
+        )
+        return hashlib.blake2b(raw, digest_size=16).digest()
+
+    async def generate(self,
+                      system_prompt: str,
+                      user_message: str,
+                      response_format: Optional[Dict[str, Any]] = None,
+                      temperature: float = 0.7) -> str:
+        """Generate with an exact-match lookup before hitting the LLM"""
+        key = self._cache_key(system_prompt, user_message, response_format, temperature)
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        response = await self.inner.generate(
+            system_prompt=system_prompt,
+            user_message=user_message,
+            response_format=response_format,
+            temperature=temperature
+        )
+
+        self._cache[key] = response
+        if len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+
+        return response
+
+    async def generate_with_tools(self,
+                                  system_prompt: str,
+                                  messages: List[Dict[str, str]],
+                                  tools: List[Dict[str, Any]],
+                                  temperature: float = 0.7) -> Dict[str, Any]:
+        """Tool calls are stateful, so they bypass the cache"""
+        return await self.inner.generate_with_tools(
+            system_prompt=system_prompt,
+            messages=messages,
+            tools=tools,
+            temperature=temperature
+        )
+
+
+class SemanticCacheClient(BaseLLMClient):
+    """
+    Wraps another LLM client with an embedding-based response cache.
+    Semantically identical prompts short-circuit to the cached response
+    instead of paying a full network/inference round-trip.
+
+    Uses sentence-transformers + FAISS when available; degrades to a
+    transparent pass-through if either optional dependency is missing.
+    """
+
+    __slots__ = ("inner", "similarity_threshold", "max_entries",
+                 "_model", "_index", "_responses", "_disabled")
+
+    def __init__(self,
+                 inner: BaseLLMClient,
+                 similarity_threshold: float = 0.95,
+                 max_entries: int = 256):
+        self.inner = inner
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        self._model = None
+        self._index = None
+        self._responses: List[str] = []
+        self._disabled = False
+
+    def _get_model(self):
+        """Lazily load the embedding model and FAISS index"""
+        if self._disabled:
+            return None
+        if self._model is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+                import faiss
+            except ImportError:
+                self._disabled = True
+                return None
+            self._model = SentenceTransformer("all-MiniLM-L6-v2")
+            dim = self._model.get_sentence_embedding_dimension()
+            self._index = faiss.IndexFlatIP(dim)
+        return self._model
+
+    def _embed(self, text: str):
+        # Normalized embeddings make inner product == cosine similarity
+        return self._model.encode([text], normalize_embeddings=True)
+
+    async def generate(self,
+                      system_prompt: str,
+                      user_message: str,
+                      response_format: Optional[Dict[str, Any]] = None,
+                      temperature: float = 0.7) -> str:
+        """Generate with semantic cache lookup before hitting the LLM"""
+        model = self._get_model()
+        if model is None:
+            return await self.inner.generate(
+                system_prompt=system_prompt,
+                user_message=user_message,
+                response_format=response_format,
+                temperature=temperature
+            )
+
+        cache_key = "\x1f".join((system_prompt, user_message, str(response_format)))
+        embedding = self._embed(cache_key)
+
+        if self._index.ntotal > 0:
+            scores, ids = self._index.search(embedding, 1)
+            if scores[0][0] >= self.similarity_threshold:
+                return self._responses[ids[0][0]]
+
+        response = await self.inner.generate(
+            system_prompt=system_prompt,
+            user_message=user_message,
+            response_format=response_format,
+            temperature=temperature
+        )
+
+        # Simple size cap; a flat index has no cheap per-entry eviction
+        if len(self._responses) < self.max_entries:
+            self._index.add(embedding)
+            self._responses.append(response)
+
+        return response
+
+    async def generate_with_tools(self,
+                                  system_prompt: str,
+                                  messages: List[Dict[str, str]],
+                                  tools: List[Dict[str, Any]],
+                                  temperature: float = 0.7) -> Dict[str, Any]:
+        """Tool calls are stateful, so they bypass the cache"""
+        return await self.inner.generate_with_tools(
+            system_prompt=system_prompt,
+            messages=messages,
+            tools=tools,
+            temperature=temperature
+        )
+
 
 class OpenAIClient(BaseLLMClient):
     """OpenAI API client"""
-    
+
+    __slots__ = ("api_key", "model")
+
+    _max_concurrency = 20
+
+    # One SDK client (and its HTTPX connection pool) per API key, shared by
+    # all instances so concurrent sessions reuse the same connections.
+    _shared_clients: Dict[str, Any] = {}
+
     def __init__(self, api_key: str, model: str = "gpt-4o"):
         self.api_key = api_key
         self.model = model
-        self._client = None
-    
+
     def _get_client(self):
-        if self._client is None:
-            from openai import AsyncOpenAI
-            self._client = AsyncOpenAI(api_key=self.api_key)
-        return self._client
+        client = OpenAIClient._shared_clients.get(self.api_key)
+        if client is None:
+            client = _get_async_openai_cls()(api_key=self.api_key, max_retries=2)
+            OpenAIClient._shared_clients[self.api_key] = client
+        return client
     
     async def generate(self,
                       system_prompt: str,
@@ -99,23 +396,29 @@ class OpenAIClient(BaseLLMClient):
         }
         
         if getattr(message, "tool_calls", None):
+            # The SDK guarantees these attributes exist, so access them
+            # directly with a try/except guard instead of paying for a
+            # defaulted getattr chain per iteration.
+            tc_append = result["tool_calls"].append
+            loads = _json_loads
             for tool_call in message.tool_calls:
-                function = getattr(tool_call, "function", None)
-                if function is None:
+                try:
+                    function = tool_call.function
+                    name = function.name
+                    arguments_raw = function.arguments
+                    call_id = tool_call.id
+                except AttributeError:
                     continue
-
-                name = getattr(function, "name", None)
-                arguments_raw = getattr(function, "arguments", "{}")
                 if not isinstance(name, str) or not name:
                     continue
 
                 try:
-                    arguments = json.loads(arguments_raw) if isinstance(arguments_raw, str) else (arguments_raw or {})
+                    arguments = loads(arguments_raw) if isinstance(arguments_raw, str) else (arguments_raw or {})
                 except Exception:
                     arguments = {}
 
-                result["tool_calls"].append({
-                    "id": getattr(tool_call, "id", ""),
+                tc_append({
+                    "id": call_id or "",
                     "name": name,
                     "arguments": arguments
                 })
@@ -125,17 +428,24 @@ class OpenAIClient(BaseLLMClient):
 
 class AnthropicClient(BaseLLMClient):
     """Anthropic Claude API client"""
-    
+
+    __slots__ = ("api_key", "model")
+
+    _max_concurrency = 10
+
+    # Shared per-key SDK clients, mirroring OpenAIClient
+    _shared_clients: Dict[str, Any] = {}
+
     def __init__(self, api_key: str, model: str = "claude-3-5-sonnet-20241022"):
         self.api_key = api_key
         self.model = model
-        self._client = None
-    
+
     def _get_client(self):
-        if self._client is None:
-            from anthropic import AsyncAnthropic
-            self._client = AsyncAnthropic(api_key=self.api_key)
-        return self._client
+        client = AnthropicClient._shared_clients.get(self.api_key)
+        if client is None:
+            client = _get_async_anthropic_cls()(api_key=self.api_key, max_retries=2)
+            AnthropicClient._shared_clients[self.api_key] = client
+        return client
     
     async def generate(self,
                       system_prompt: str,
@@ -160,11 +470,13 @@ class AnthropicClient(BaseLLMClient):
             temperature=temperature
         )
 
-        for block in getattr(response, "content", []) or []:
-            if getattr(block, "type", None) == "text" and hasattr(block, "text"):
+        # The SDK guarantees content is a list of typed blocks, so read the
+        # attributes directly instead of paying a getattr/hasattr chain.
+        for block in response.content:
+            if block.type == "text":
                 return block.text
 
-        # Fallback: stringify if the SDK returns an unexpected structure
+        # Fallback: stringify if no text block came back
         return str(response)
     
     async def generate_with_tools(self,
@@ -201,29 +513,128 @@ class AnthropicClient(BaseLLMClient):
             "tool_calls": []
         }
         
+        tc_append = result["tool_calls"].append
         for block in response.content:
             if block.type == "text":
                 result["content"] = block.text
             elif block.type == "tool_use":
-                result["tool_calls"].append({
+                tc_append({
                     "id": block.id,
                     "name": block.name,
                     "arguments": block.input
                 })
-        
+
         return result
 
 
+# Static tail of the Ollama tool-selection prompt; only the system prompt,
+# tool descriptions and conversation vary per call, so the ~400-byte
+# instruction block is built once here instead of per request.
+_OLLAMA_TOOL_INSTRUCTION_TAIL = """
+Based on the user's request, decide if you need to use a tool.
+If yes, respond with JSON in this exact format:
+{
+    "use_tool": true,
+    "tool_name": "<tool_name>",
+    "tool_arguments": {...},
+    "message": "<brief message to user>"
+}
+
+If no tool is needed, respond with:
+{
+    "use_tool": false,
+    "message": "<your response to the user>"
+}
+
+Respond with valid JSON only:"""
+
+
+# Mock responses are constant apart from the planning query, so serialize
+# them once at import time. The plan JSON is split around a sentinel where
+# the user message gets interpolated (as a properly quoted JSON string).
+_MOCK_PLAN_PREFIX, _MOCK_PLAN_SUFFIX = _json_dumps({
+    "goal": "सरकारी योजना शोधणे",
+    "reasoning": "वापरकर्त्याला योग्य योजना शोधण्यात मदत करणे आवश्यक आहे",
+    "tasks": [
+        {
+            "id": "task_1",
+            "description": "वापरकर्त्याची माहिती गोळा करा",
+            "tool_name": "eligibility_checker",
+            "tool_params": {},
+            "dependencies": []
+        },
+        {
+            "id": "task_2",
+            "description": "योजना शोधा",
+            "tool_name": "scheme_retriever",
+            "tool_params": {"query": "__MOCK_QUERY__"},
+            "dependencies": ["task_1"]
+        }
+    ],
+    "missing_info": ["age", "income"],
+    "clarifying_questions": ["तुमचे वय किती आहे?", "तुमचे वार्षिक उत्पन्न किती आहे?"]
+}).split('"__MOCK_QUERY__"')
+
+_MOCK_EVAL_JSON = _json_dumps({
+    "success": True,
+    "confidence": 0.85,
+    "needs_replanning": False,
+    "missing_information": [],
+    "contradictions": [],
+    "suggestions": [],
+    "next_action": "respond_to_user",
+    "user_response": "तुम्ही पीएम किसान योजनेसाठी पात्र आहात."
+})
+
+_MOCK_EXTRACT_FARMER = _json_dumps({
+    "age": None,
+    "income": None,
+    "occupation": "शेतकरी",
+    "intent": "scheme_search"
+})
+
+_MOCK_EXTRACT_NONE = _json_dumps({
+    "age": None,
+    "income": None,
+    "occupation": None,
+    "intent": "scheme_search"
+})
+
+_MOCK_DEFAULT_JSON = _json_dumps({
+    "response": "मी तुम्हाला सरकारी योजनांबद्दल मदत करतो. कृपया तुमची माहिती सांगा.",
+    "eligible_schemes": [],
+    "next_steps": ["प्रथम तुमचे वय सांगा", "तुमचे उत्पन्न सांगा"]
+})
+
+_MOCK_TEXT_RESPONSE = "नमस्कार! मी तुमचा सरकारी योजना सहाय्यक आहे. मी तुम्हाला योग्य योजना शोधण्यात आणि अर्ज करण्यात मदत करतो. कृपया तुमची माहिती सांगा."
+
+# Branch table for the mock's JSON responses: (predicate, builder) pairs
+# scanned in order against the raw prompt, its lowercase form, and the
+# user message. Keeps generate() to a single lowercase pass and one walk.
+_MOCK_JSON_BRANCHES = (
+    (lambda sp, spl, um: "योजना" in sp or "plan" in spl,
+     lambda um: "".join((_MOCK_PLAN_PREFIX, _json_dumps(um), _MOCK_PLAN_SUFFIX))),
+    (lambda sp, spl, um: "मूल्यांकन" in sp or "evaluat" in spl,
+     lambda um: _MOCK_EVAL_JSON),
+    (lambda sp, spl, um: "extract" in spl or "काढा" in sp,
+     lambda um: _MOCK_EXTRACT_FARMER if "शेतकरी" in um else _MOCK_EXTRACT_NONE),
+)
+
+
 class MockLLMClient(BaseLLMClient):
     """
     Mock LLM client for testing without API calls
     Returns predefined responses in Marathi
     """
-    
+
+    __slots__ = ("call_count", "last_prompt")
+
+    _max_concurrency = 1000
+
     def __init__(self):
         self.call_count = 0
         self.last_prompt = None
-    
+
     async def generate(self,
                       system_prompt: str,
                       user_message: str,
@@ -232,62 +643,19 @@ class MockLLMClient(BaseLLMClient):
         """Generate a mock response"""
         self.call_count += 1
         self.last_prompt = user_message
-        
+
         # Return JSON for planning/evaluation prompts
         if response_format and response_format.get("type") == "json_object":
-            if "योजना" in system_prompt or "plan" in system_prompt.lower():
-                return json.dumps({
-                    "goal": "सरकारी योजना शोधणे",
-                    "reasoning": "वापरकर्त्याला योग्य योजना शोधण्यात मदत करणे आवश्यक आहे",
-                    "tasks": [
-                        {
-                            "id": "task_1",
-                            "description": "वापरकर्त्याची माहिती गोळा करा",
-                            "tool_name": "eligibility_checker",
-                            "tool_params": {},
-                            "dependencies": []
-                        },
-                        {
-                            "id": "task_2",
-                            "description": "योजना शोधा",
-                            "tool_name": "scheme_retriever",
-                            "tool_params": {"query": user_message},
-                            "dependencies": ["task_1"]
-                        }
-                    ],
-                    "missing_info": ["age", "income"],
-                    "clarifying_questions": ["तुमचे वय किती आहे?", "तुमचे वार्षिक उत्पन्न किती आहे?"]
-                }, ensure_ascii=False)
-            
-            elif "मूल्यांकन" in system_prompt or "evaluat" in system_prompt.lower():
-                return json.dumps({
-                    "success": True,
-                    "confidence": 0.85,
-                    "needs_replanning": False,
-                    "missing_information": [],
-                    "contradictions": [],
-                    "suggestions": [],
-                    "next_action": "respond_to_user",
-                    "user_response": "तुम्ही पीएम किसान योजनेसाठी पात्र आहात."
-                }, ensure_ascii=False)
-            
-            elif "extract" in system_prompt.lower() or "काढा" in system_prompt:
-                return json.dumps({
-                    "age": None,
-                    "income": None,
-                    "occupation": "शेतकरी" if "शेतकरी" in user_message else None,
-                    "intent": "scheme_search"
-                }, ensure_ascii=False)
-            
-            else:
-                return json.dumps({
-                    "response": "मी तुम्हाला सरकारी योजनांबद्दल मदत करतो. कृपया तुमची माहिती सांगा.",
-                    "eligible_schemes": [],
-                    "next_steps": ["प्रथम तुमचे वय सांगा", "तुमचे उत्पन्न सांगा"]
-                }, ensure_ascii=False)
-        
+            prompt_lower = system_prompt.lower()
+
+            for predicate, build in _MOCK_JSON_BRANCHES:
+                if predicate(system_prompt, prompt_lower, user_message):
+                    return build(user_message)
+
+            return _MOCK_DEFAULT_JSON
+
         # Return text response
-        return "नमस्कार! मी तुमचा सरकारी योजना सहाय्यक आहे. मी तुम्हाला योग्य योजना शोधण्यात आणि अर्ज करण्यात मदत करतो. कृपया तुमची माहिती सांगा."
+        return _MOCK_TEXT_RESPONSE
     
     async def generate_with_tools(self,
                                   system_prompt: str,
@@ -318,51 +686,129 @@ class OllamaClient(BaseLLMClient):
     Install: https://ollama.ai/download
     Then run: ollama pull llama3.2
     """
-    
-    def __init__(self, base_url: str = "http://localhost:11434", model: str = "llama3.2"):
+
+    __slots__ = ("base_url", "model", "keep_alive", "_session", "_call_counter",
+                 "_avail_cache")
+
+    # A single local model gains nothing from concurrent requests
+    _max_concurrency = 1
+
+    # How long a check_available result stays fresh, in seconds
+    _AVAIL_TTL = 5.0
+
+    def __init__(self,
+                 base_url: str = "http://localhost:11434",
+                 model: str = "llama3.2",
+                 keep_alive: str = "10m"):
         self.base_url = base_url.rstrip('/')
         self.model = model
-    
-    async def generate(self,
-                      system_prompt: str,
-                      user_message: str,
-                      response_format: Optional[Dict[str, Any]] = None,
-                      temperature: float = 0.7) -> str:
-        """Generate a response using Ollama"""
+        # How long the server keeps the model (and its KV state) resident
+        # after a request; avoids reload/re-prefill between session turns.
+        self.keep_alive = keep_alive
+        self._session = None
+        self._call_counter = 0
+        self._avail_cache: Tuple[float, bool] = (0.0, False)
+
+    async def _get_session(self):
+        """Lazily create one shared ClientSession with a keep-alive pool.
+
+        A per-request session forces a fresh TCP handshake and DNS lookup
+        on every call and throws the connection pool away.
+        """
         import aiohttp
-        
-        # Build the prompt
+
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=64, keepalive_timeout=60)
+            )
+        return self._session
+
+    async def aclose(self):
+        """Close the shared HTTP session (for graceful shutdown)"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _build_generate_payload(self,
+                                system_prompt: str,
+                                user_message: str,
+                                response_format: Optional[Dict[str, Any]],
+                                temperature: float,
+                                stream: bool) -> Dict[str, Any]:
+        """Build the /api/generate request payload"""
         prompt = f"{system_prompt}\n\nUser: {user_message}\nAssistant:"
-        
+
         # Add JSON instruction if needed
-        if response_format and response_format.get("type") == "json_object":
+        wants_json = response_format and response_format.get("type") == "json_object"
+        if wants_json:
             prompt += " (Respond ONLY with valid JSON, no other text)"
-        
+
         payload = {
             "model": self.model,
             "prompt": prompt,
-            "stream": False,
+            "stream": stream,
+            "keep_alive": self.keep_alive,
             "options": {
                 "temperature": temperature
             }
         }
-        
-        # If JSON format requested, set format
-        if response_format and response_format.get("type") == "json_object":
+        if wants_json:
             payload["format"] = "json"
-        
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{self.base_url}/api/generate",
-                json=payload,
-                timeout=aiohttp.ClientTimeout(total=120)
-            ) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise Exception(f"Ollama error: {error_text}")
-                
-                result = await response.json()
-                return result.get("response", "")
+        return payload
+
+    async def generate_stream(self,
+                              system_prompt: str,
+                              user_message: str,
+                              response_format: Optional[Dict[str, Any]] = None,
+                              temperature: float = 0.7):
+        """Yield response text incrementally as Ollama produces it.
+
+        Callers driving TTS should prefer this over generate(): the first
+        sentence can be spoken while later tokens are still decoding.
+        """
+        import aiohttp
+
+        payload = self._build_generate_payload(
+            system_prompt, user_message, response_format, temperature, stream=True
+        )
+
+        session = await self._get_session()
+        async with session.post(
+            f"{self.base_url}/api/generate",
+            data=_json_dumps_bytes(payload),
+            headers={"Content-Type": "application/json"},
+            timeout=aiohttp.ClientTimeout(total=120)
+        ) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                raise Exception(f"Ollama error: {error_text}")
+
+            # Ollama streams one JSON object per line
+            async for line in response.content:
+                if not line.strip():
+                    continue
+                chunk = _json_loads(line)
+                piece = chunk.get("response")
+                if piece:
+                    yield piece
+                if chunk.get("done"):
+                    break
+
+    async def generate(self,
+                      system_prompt: str,
+                      user_message: str,
+                      response_format: Optional[Dict[str, Any]] = None,
+                      temperature: float = 0.7) -> str:
+        """Generate a response using Ollama"""
+        chunks = []
+        async for piece in self.generate_stream(
+            system_prompt=system_prompt,
+            user_message=user_message,
+            response_format=response_format,
+            temperature=temperature
+        ):
+            chunks.append(piece)
+        return "".join(chunks)
     
     async def generate_with_tools(self,
                                   system_prompt: str,
@@ -375,76 +821,61 @@ class OllamaClient(BaseLLMClient):
         """
         import aiohttp
         
-        # Build tool descriptions
-        tool_desc = "Available tools:\n"
-        for tool in tools:
-            if tool.get("type") == "function":
-                func = tool["function"]
-                tool_desc += f"- {func['name']}: {func['description']}\n"
-                tool_desc += f"  Parameters: {json.dumps(func['parameters'], indent=2)}\n\n"
-        
+        # Build tool descriptions (memoized per unique tool list)
+        tool_desc = _format_tool_descriptions(_tools_cache_key(tools))
+
         # Build conversation
-        conversation = ""
-        for msg in messages:
-            role = msg.get("role", "user")
-            content = msg.get("content", "")
-            conversation += f"{role.capitalize()}: {content}\n"
+        conversation = "".join(
+            f"{msg.get('role', 'user').capitalize()}: {msg.get('content', '')}\n"
+            for msg in messages
+        )
         
-        # Build prompt asking for tool selection
-        prompt = f"""{system_prompt}
-
-{tool_desc}
-
-Conversation:
-{conversation}
-
-Based on the user's request, decide if you need to use a tool. 
-If yes, respond with JSON in this exact format:
-{{
-    "use_tool": true,
-    "tool_name": "<tool_name>",
-    "tool_arguments": {{...}},
-    "message": "<brief message to user>"
-}}
-
-If no tool is needed, respond with:
-{{
-    "use_tool": false,
-    "message": "<your response to the user>"
-}}
-
-Respond with valid JSON only:"""
+        # Build prompt asking for tool selection; the static instruction
+        # tail is a module constant, so this is one join of five segments.
+        prompt = "".join((
+            system_prompt, "\n\n",
+            tool_desc, "\n\nConversation:\n",
+            conversation,
+            _OLLAMA_TOOL_INSTRUCTION_TAIL
+        ))
         
         payload = {
             "model": self.model,
             "prompt": prompt,
             "stream": False,
             "format": "json",
+            "keep_alive": self.keep_alive,
             "options": {
                 "temperature": temperature
             }
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{self.base_url}/api/generate",
-                json=payload,
-                timeout=aiohttp.ClientTimeout(total=120)
-            ) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise Exception(f"Ollama error: {error_text}")
-                
-                result = await response.json()
-                response_text = result.get("response", "{}")
+        session = await self._get_session()
+        # Pre-serialize with orjson instead of letting aiohttp run the
+        # payload through the stdlib json encoder.
+        async with session.post(
+            f"{self.base_url}/api/generate",
+            data=_json_dumps_bytes(payload),
+            headers={"Content-Type": "application/json"},
+            timeout=aiohttp.ClientTimeout(total=120)
+        ) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                raise Exception(f"Ollama error: {error_text}")
+
+            result = await response.json()
+            response_text = result.get("response", "{}")
         
         try:
-            parsed = json.loads(response_text)
+            parsed = _json_loads(response_text)
             
             tool_calls = []
             if parsed.get("use_tool", False):
+                # Monotonic counter: cheaper than hashing the tool name and
+                # cannot produce duplicate IDs the way hash % 10000 can.
+                self._call_counter += 1
                 tool_calls.append({
-                    "id": f"call_{hash(parsed.get('tool_name', '')) % 10000}",
+                    "id": f"call_{self._call_counter}",
                     "name": parsed.get("tool_name", ""),
                     "arguments": parsed.get("tool_arguments", {})
                 })
@@ -453,48 +884,135 @@ Respond with valid JSON only:"""
                 "content": parsed.get("message", ""),
                 "tool_calls": tool_calls
             }
-        except json.JSONDecodeError:
+        except ValueError:
             return {
                 "content": response_text,
                 "tool_calls": []
             }
     
     async def check_available(self) -> bool:
-        """Check if Ollama is running and the model is available"""
+        """Check if Ollama is running and the model is available.
+
+        Health checks hit this repeatedly, so the probe result is cached
+        for a few seconds; within the TTL the answer is a tuple read with
+        no network round-trip.
+        """
+        checked_at, available = self._avail_cache
+        if time.monotonic() - checked_at < self._AVAIL_TTL:
+            return available
+
         import aiohttp
+
+        available = False
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.base_url}/api/tags",
-                    timeout=aiohttp.ClientTimeout(total=5)
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        models = [m.get("name", "").split(":")[0] for m in data.get("models", [])]
-                        return self.model.split(":")[0] in models
-            return False
-        except:
-            return False
+            session = await self._get_session()
+            async with session.get(
+                f"{self.base_url}/api/tags",
+                timeout=aiohttp.ClientTimeout(total=5)
+            ) as response:
+                if response.status == 200:
+                    data = _json_loads(await response.read())
+                    models = [m.get("name", "").split(":")[0] for m in data.get("models", [])]
+                    available = self.model.split(":")[0] in models
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            # Scoped so KeyboardInterrupt/SystemExit still propagate
+            logger.debug("Ollama availability probe failed: %s", e)
+
+        self._avail_cache = (time.monotonic(), available)
+        return available
+
+
+# Provider name -> client class, built once instead of per create() call
+_PROVIDERS: Dict[str, type] = {
+    "openai": OpenAIClient,
+    "anthropic": AnthropicClient,
+    "ollama": OllamaClient,
+    "mock": MockLLMClient
+}
 
 
 class LLMClientFactory:
     """Factory for creating LLM clients"""
-    
+
+    @staticmethod
+    def install_fast_event_loop():
+        """Install the fastest available asyncio event loop policy.
+
+        Call once at service startup, before any client is created: uvloop
+        cuts per-call asyncio overhead substantially for aiohttp/httpx
+        workloads. Deliberately not run at import time so embedders keep
+        control of their own loop policy.
+        """
+        import sys
+
+        if sys.platform == "win32":
+            # uvloop is Unix-only; the selector policy keeps aiohttp happy
+            asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+            return
+
+        try:
+            import uvloop
+        except ImportError:
+            return
+        uvloop.install()
+
     @staticmethod
-    def create(provider: str = "ollama", **kwargs) -> BaseLLMClient:
+    def create(provider: str = "ollama",
+               semantic_cache: bool = False,
+               exact_cache: bool = False,
+               **kwargs) -> BaseLLMClient:
         """Create an LLM client based on provider"""
-        providers = {
-            "openai": OpenAIClient,
-            "anthropic": AnthropicClient,
-            "ollama": OllamaClient,
-            "mock": MockLLMClient
-        }
-        
-        if provider not in providers:
+        client_cls = _PROVIDERS.get(provider)
+        if client_cls is None:
             raise ValueError(f"Unknown LLM provider: {provider}")
-        
-        return providers[provider](**kwargs)
+
+        client = client_cls(**kwargs)
+        if semantic_cache:
+            client = SemanticCacheClient(client)
+        if exact_cache:
+            # Outermost so identical repeats never reach the embedding tier
+            client = ExactCacheClient(client)
+        return client
     
+    _announced = False
+
+    # Process-wide client built from settings, shared across interfaces so
+    # restarts within a warm process reuse the same HTTP session/pool.
+    _settings_client: Optional[BaseLLMClient] = None
+
+    @staticmethod
+    def get_or_create() -> BaseLLMClient:
+        """Return the shared settings-based client, creating it on first use"""
+        client = LLMClientFactory._settings_client
+        if client is None:
+            client = LLMClientFactory.create_from_settings()
+            LLMClientFactory._settings_client = client
+        return client
+
+    # Cheap planner-tier client, shared for the same reason as above.
+    _small_planner_client: Optional[BaseLLMClient] = None
+
+    @staticmethod
+    def get_or_create_planner_small() -> Optional[BaseLLMClient]:
+        """Return the cheap planner-tier client, or None when tiering is off.
+
+        Tiering only pays when planner_small_model differs from the main
+        Ollama model; otherwise both tiers would hit the same model and the
+        escalation retry would just add latency.
+        """
+        from ..config import settings
+
+        if settings.planner_small_model == settings.ollama_model:
+            return None
+        client = LLMClientFactory._small_planner_client
+        if client is None:
+            client = OllamaClient(
+                base_url=settings.ollama_base_url,
+                model=settings.planner_small_model
+            )
+            LLMClientFactory._small_planner_client = client
+        return client
+
     @staticmethod
     def create_from_settings() -> BaseLLMClient:
         """Create LLM client from environment settings - prioritizes free local Ollama"""
@@ -505,7 +1023,11 @@ class LLMClientFactory:
             base_url=settings.ollama_base_url,
             model=settings.ollama_model
         )
-        print(f"Using Ollama with model: {settings.ollama_model}")
-        print(f"Make sure Ollama is running: ollama serve")
-        print(f"And model is pulled: ollama pull {settings.ollama_model}")
+        # Announce once per process; blocking stdout writes don't belong on
+        # the client-creation path.
+        if not LLMClientFactory._announced:
+            logger.info("Using Ollama with model: %s", settings.ollama_model)
+            logger.info("Make sure Ollama is running: ollama serve")
+            logger.info("And model is pulled: ollama pull %s", settings.ollama_model)
+            LLMClientFactory._announced = True
         return ollama_client
@@ -3,8 +3,13 @@ Main Voice Interface
 End-to-end voice interaction loop for the government scheme agent
 """
 import asyncio
+import itertools
+import re
+import time
 import uuid
-from typing import Optional, Dict, Any, Callable
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Callable, Mapping
 from datetime import datetime
 from rich.console import Console
 from rich.panel import Panel
@@ -21,63 +26,197 @@ from .llm import LLMClientFactory
 
 console = Console()
 
+# Exit commands, compiled once instead of a per-turn substring scan over a
+# freshly built list. Word boundaries only apply to the ASCII commands;
+# the Devanagari phrases match as substrings like before.
+_EXIT_RE = re.compile(r"बंद करा|थांबा|बाय|\bexit\b|\bquit\b")
+
+# Per-turn status lines as pre-built Text objects; keeps Rich's markup
+# parser out of the hot loop.
+_STATUS_SPEAK = Text("\n🎤 बोला... / Speak...", style="bold cyan")
+_STATUS_LISTENING = Text("ऐकत आहे...", style="yellow")
+_STATUS_HEARD = Text("✓ ऐकले", style="green")
+_STATUS_TRANSCRIBING = Text("🔄 समजून घेत आहे...", style="cyan")
+_STATUS_THINKING = Text("🤔 विचार करत आहे...", style="cyan")
+_STATUS_SPEAKING = Text("🔊 बोलत आहे...", style="cyan")
+
+# High-frequency pleasantries that don't need the agent loop: normalized
+# utterance -> canned response. Hits skip an entire LLM round-trip.
+_CANNED_RESPONSES = {
+    "धन्यवाद": "तुमचे स्वागत आहे! आणखी काही मदत हवी असल्यास नक्की विचारा.",
+    "thank you": "तुमचे स्वागत आहे! आणखी काही मदत हवी असल्यास नक्की विचारा.",
+    "thanks": "तुमचे स्वागत आहे! आणखी काही मदत हवी असल्यास नक्की विचारा.",
+    "नमस्कार": "नमस्कार! तुम्हाला कोणत्या योजनेची माहिती हवी आहे?",
+    "hello": "नमस्कार! तुम्हाला कोणत्या योजनेची माहिती हवी आहे?",
+    "hi": "नमस्कार! तुम्हाला कोणत्या योजनेची माहिती हवी आहे?",
+    "ठीक आहे": "छान! आणखी काही माहिती हवी असल्यास विचारा.",
+}
+
+# Strip common punctuation only; a bare \W class would also eat the
+# Devanagari combining marks that spell the words themselves.
+_PUNCTUATION_RE = re.compile(r"[!?.,;:।॥'\"()\-]+")
+
+
+@lru_cache(maxsize=256)
+def _canned_response(text: str) -> Optional[str]:
+    """Look up a canned response for a normalized utterance, if any"""
+    normalized = " ".join(_PUNCTUATION_RE.sub(" ", text.lower()).split())
+    return _CANNED_RESPONSES.get(normalized)
+
+
+# Constant farewell line, pre-synthesized at session start so exit is instant
+_FAREWELL = "धन्यवाद! तुमचा दिवस शुभ जावो."
+_FAREWELL_TEXT = Text("\n" + _FAREWELL, style="green")
+
+# Greeting per language, immutable and built once at import time
+_GREETINGS: Mapping[str, str] = MappingProxyType({
+    "marathi": "नमस्कार! मी तुमचा सरकारी योजना सहाय्यक आहे. मी तुम्हाला योग्य योजना शोधण्यात आणि अर्ज करण्यात मदत करतो. तुम्हाला कोणत्या प्रकारच्या योजनेची माहिती हवी आहे?",
+    "hindi": "नमस्ते! मैं आपका सरकारी योजना सहायक हूं। मैं आपको सही योजना खोजने और आवेदन करने में मदद करता हूं। आपको किस प्रकार की योजना की जानकारी चाहिए?",
+    "telugu": "నమస్కారం! నేను మీ ప్రభుత్వ పథకాల సహాయకుడిని. మీకు సరైన పథకాన్ని కనుగొని దరఖాస్తు చేయడంలో సహాయపడతాను. మీకు ఏ రకమైన పథకం గురించి సమాచారం కావాలి?",
+    "tamil": "வணக்கம்! நான் உங்கள் அரசு திட்ட உதவியாளர். சரியான திட்டத்தைக் கண்டறிந்து விண்ணப்பிக்க உதவுகிறேன். எந்த வகையான திட்டம் பற்றிய தகவல் வேண்டும்?",
+    "bengali": "নমস্কার! আমি আপনার সরকারি প্রকল্প সহায়ক। আমি আপনাকে সঠিক প্রকল্প খুঁজে বের করতে এবং আবেদন করতে সাহায্য করি। আপনার কোন ধরনের প্রকল্পের তথ্য দরকার?"
+})
+
+# Menu choice -> language for the startup prompt
+_LANGUAGE_CHOICES: Mapping[str, str] = MappingProxyType({
+    "1": "marathi",
+    "2": "hindi",
+    "3": "telugu",
+    "4": "tamil",
+    "5": "bengali"
+})
+
+# Greeting panels are identical per language, so build each at most once
+_GREETING_PANELS: Dict[str, Panel] = {}
+
+
+def _greeting_panel(language: str, greeting: str) -> Panel:
+    panel = _GREETING_PANELS.get(language)
+    if panel is None:
+        panel = Panel(
+            Text(greeting, style="green"),
+            title="🙏 स्वागत / Welcome",
+            border_style="green"
+        )
+        _GREETING_PANELS[language] = panel
+    return panel
+
 
 class VoiceInterface:
     """
     Main voice interface for the government scheme agent
     Handles complete voice-to-voice interaction loop
     """
+
+    # Seconds _speak stays silent after a TTS failure
+    _TTS_COOLDOWN = 30.0
     
     def __init__(self, language: str = "marathi"):
         self.language = language
         self.memory_manager = MemoryManager()
-        
-        # Initialize components
-        self._setup_components()
-        
+
+        # Components are created in setup() so independent backend probes
+        # (STT/TTS model loads, network checks) can run concurrently
+        self._components_ready = False
+
         # State
         self.current_session_id: Optional[str] = None
+        self._session: Optional[SessionMemory] = None
         self.is_running = False
-        
+
+        # Circuit breaker: after a TTS failure, _speak stays silent for a
+        # cooldown window instead of re-paying a full backend timeout on
+        # every turn while the backend is down
+        self._tts_unhealthy_until: float = 0.0
+
+        # Farewell audio, synthesized ahead of time and cached across sessions
+        self._farewell_task: Optional[asyncio.Task] = None
+        self._farewell_result = None
+
         # Callbacks
         self.on_listening_start: Optional[Callable] = None
         self.on_listening_end: Optional[Callable] = None
         self.on_processing: Optional[Callable] = None
         self.on_speaking: Optional[Callable] = None
         self.on_error: Optional[Callable] = None
-    
-    def _setup_components(self):
-        """Initialize all components"""
-        # LLM Client
-        self.llm_client = LLMClientFactory.create_from_settings()
-        
-        # Tool Registry
+
+    def _init_agent(self):
+        """Initialize LLM client, tool registry and agent"""
+        # Shared across interfaces so warm-process restarts reuse the
+        # existing HTTP session instead of reopening connections
+        self.llm_client = LLMClientFactory.get_or_create()
+
         self.tool_registry = ToolRegistry()
         self.tool_registry.register(EligibilityChecker())
         self.tool_registry.register(SchemeRetriever())
         self.tool_registry.register(ApplicationHelper())
-        
-        # Agent
+
         self.agent = VoiceAgent(
             llm_client=self.llm_client,
             tool_registry=self.tool_registry,
             language=self.language
         )
-        
-        # Voice components
+
+    def _init_stt(self):
         self.stt = STTFactory.get_best_available()
+
+    def _init_tts(self):
         self.tts = TTSFactory.get_best_available()
+
+    def _init_audio(self):
         self.recorder = AudioRecorder(AudioConfig(
             sample_rate=settings.sample_rate,
             channels=settings.audio_channels
         ))
         self.player = AudioPlayer(sample_rate=settings.sample_rate)
-    
+        # Keep playback off the event loop so concurrent STT/LLM work and
+        # Rich rendering can't cause audio underruns
+        self.player.start_worker()
+
+    async def setup(self):
+        """Initialize all components, probing backends concurrently.
+
+        STT/TTS factory probes can each take seconds (model weights,
+        network checks); running the four independent initializers in
+        worker threads makes cold start max() instead of sum() of them.
+        """
+        if self._components_ready:
+            return
+
+        await asyncio.gather(
+            asyncio.to_thread(self._init_agent),
+            asyncio.to_thread(self._init_stt),
+            asyncio.to_thread(self._init_tts),
+            asyncio.to_thread(self._init_audio),
+        )
+        self._components_ready = True
+
+    def _setup_components(self):
+        """Initialize all components serially (synchronous fallback)"""
+        self._init_agent()
+        self._init_stt()
+        self._init_tts()
+        self._init_audio()
+        self._components_ready = True
+
     def start_session(self) -> str:
         """Start a new interaction session"""
         session_id = self.agent.create_session()
         self.current_session_id = session_id
-        self.memory_manager.create_session(session_id, self.language)
+        # Keep the SessionMemory reference; the per-turn hot path reads it
+        # directly instead of re-fetching through the manager every call
+        self._session = self.memory_manager.create_session(session_id, self.language)
+
+        # Kick off farewell synthesis in the background; the clip is
+        # constant, so by exit time it is already rendered.
+        if (self._farewell_result is None and self._farewell_task is None
+                and self._components_ready):
+            try:
+                self._farewell_task = asyncio.create_task(
+                    self.tts.synthesize(_FAREWELL, self.language)
+                )
+            except RuntimeError:
+                pass  # No running loop; fall back to on-demand synthesis
         
         console.print(Panel(
             f"[green]नवीन सत्र सुरू झाले[/green]\nSession ID: {session_id}",
@@ -96,26 +235,36 @@ class VoiceInterface:
         4. Synthesize response
         5. Play audio
         """
+        if not self._components_ready:
+            await self.setup()
+
         if not self.current_session_id:
             self.start_session()
 
         assert self.current_session_id is not None
-        
-        session = self.memory_manager.get_session(self.current_session_id)
+
+        session = self._session
         assert session is not None
         
         try:
             # Step 1: Record audio
-            console.print("\n[bold cyan]🎤 बोला... / Speak...[/bold cyan]")
+            console.print(_STATUS_SPEAK)
             
             if self.on_listening_start:
                 self.on_listening_start()
-            
+
+            # Warm the STT backend (model load / client init) while the
+            # user is speaking so transcription starts immediately after
+            # end-of-speech.
+            warm_up_task = asyncio.create_task(self.stt.warm_up())
+
             audio_data = await self.recorder.record_with_vad(
-                on_speech_start=lambda: console.print("[yellow]ऐकत आहे...[/yellow]"),
-                on_speech_end=lambda: console.print("[green]✓ ऐकले[/green]")
+                on_speech_start=lambda: console.print(_STATUS_LISTENING),
+                on_speech_end=lambda: console.print(_STATUS_HEARD)
             )
-            
+
+            await warm_up_task
+
             if self.on_listening_end:
                 self.on_listening_end()
             
@@ -123,7 +272,7 @@ class VoiceInterface:
                 return {"error": "No audio recorded", "text": ""}
             
             # Step 2: Transcribe
-            console.print("[cyan]🔄 समजून घेत आहे...[/cyan]")
+            console.print(_STATUS_TRANSCRIBING)
             
             if self.on_processing:
                 self.on_processing()
@@ -148,43 +297,73 @@ class VoiceInterface:
                 audio_confidence=stt_result.confidence
             )
             
-            # Step 3: Process with agent
-            console.print("[cyan]🤔 विचार करत आहे...[/cyan]")
-            
-            response = await self.agent.process_input(
-                self.current_session_id,
-                stt_result.text,
-                stt_result.confidence
-            )
+            # Front cache: pleasantries answer instantly without the agent
+            canned = _canned_response(stt_result.text)
+            if canned is not None:
+                session.add_assistant_message(canned)
+                console.print(Panel(
+                    f"[green]{canned}[/green]",
+                    title="🤖 उत्तर / Response",
+                    border_style="green"
+                ))
+                await self._speak(canned)
+                return {
+                    "user_text": stt_result.text,
+                    "user_confidence": stt_result.confidence,
+                    "response_text": canned,
+                    "response_type": "canned",
+                    "eligible_schemes": [],
+                    "requires_input": False
+                }
+
+            # Step 3: Process with agent. The agent yields no partial
+            # text, so a live spinner shows progress until the full
+            # response lands.
+            with Live(Spinner("dots", text=_STATUS_THINKING),
+                      console=console, transient=True):
+                response = await self.agent.process_input(
+                    self.current_session_id,
+                    stt_result.text,
+                    stt_result.confidence
+                )
             
             response_text = response.get("text", "")
-            
+
+            # Steps 4 & 5 start immediately: kick off synthesis/playback so
+            # the first sentence is audible while memory updates and panel
+            # rendering below run in parallel with it.
+            speak_task = (
+                asyncio.create_task(self._speak(response_text))
+                if response_text else None
+            )
+
             # Update memory
             session.add_assistant_message(response_text)
-            
+
             # Display response
             console.print(Panel(
                 f"[green]{response_text}[/green]",
                 title="🤖 उत्तर / Response",
                 border_style="green"
             ))
-            
+
             # Display eligible schemes if any
             if response.get("eligible_schemes"):
-                schemes_text = "\n".join([
-                    f"• {s.get('name', s)}" 
-                    for s in response["eligible_schemes"][:5]
-                ])
+                # Generator + islice: no intermediate list and no slice
+                # copy when the retriever returns a long candidate list
+                schemes_text = "\n".join(
+                    f"• {s.get('name', s)}"
+                    for s in itertools.islice(response["eligible_schemes"], 5)
+                )
                 console.print(Panel(
                     schemes_text,
                     title="📋 पात्र योजना / Eligible Schemes",
                     border_style="yellow"
                 ))
-            
-            # Step 4 & 5: Synthesize and play
-            if response_text:
-                await self._speak(response_text)
-            
+
+            if speak_task is not None:
+                await speak_task
+
             return {
                 "user_text": stt_result.text,
                 "user_confidence": stt_result.confidence,
@@ -211,12 +390,15 @@ class VoiceInterface:
     
     async def process_text_input(self, text: str) -> Dict[str, Any]:
         """Process text input (for testing without microphone)"""
+        if not self._components_ready:
+            await self.setup()
+
         if not self.current_session_id:
             self.start_session()
 
         assert self.current_session_id is not None
-        
-        session = self.memory_manager.get_session(self.current_session_id)
+
+        session = self._session
         assert session is not None
         
         console.print(Panel(
@@ -228,31 +410,55 @@ class VoiceInterface:
         # Update memory
         session.add_user_message(text)
         
-        # Process with agent
-        console.print("[cyan]🤔 विचार करत आहे...[/cyan]")
-        
-        response = await self.agent.process_input(
-            self.current_session_id,
-            text,
-            1.0  # Full confidence for text input
-        )
+        # Front cache: pleasantries answer instantly without the agent
+        canned = _canned_response(text)
+        if canned is not None:
+            session.add_assistant_message(canned)
+            console.print(Panel(
+                f"[green]{canned}[/green]",
+                title="🤖 उत्तर / Response",
+                border_style="green"
+            ))
+            await self._speak(canned)
+            return {
+                "user_text": text,
+                "response_text": canned,
+                "response_type": "canned",
+                "eligible_schemes": [],
+                "requires_input": False
+            }
+
+        # Process with agent, with a live spinner while the loop runs
+        with Live(Spinner("dots", text=_STATUS_THINKING),
+                  console=console, transient=True):
+            response = await self.agent.process_input(
+                self.current_session_id,
+                text,
+                1.0  # Full confidence for text input
+            )
         
         response_text = response.get("text", "")
-        
+
+        # Start speaking right away; memory update and panel rendering
+        # overlap with the first sentence's synthesis.
+        speak_task = (
+            asyncio.create_task(self._speak(response_text))
+            if response_text else None
+        )
+
         # Update memory
         session.add_assistant_message(response_text)
-        
+
         # Display response
         console.print(Panel(
             f"[green]{response_text}[/green]",
             title="🤖 उत्तर / Response",
             border_style="green"
         ))
-        
-        # Speak response
-        if response_text:
-            await self._speak(response_text)
-        
+
+        if speak_task is not None:
+            await speak_task
+
         return {
             "user_text": text,
             "response_text": response_text,
@@ -262,30 +468,83 @@ class VoiceInterface:
         }
     
     async def _speak(self, text: str):
-        """Synthesize and play text"""
+        """Synthesize and play text, overlapping synthesis with playback.
+
+        Sentences are synthesized and played through a small queue so the
+        first sentence is audible while later ones are still rendering,
+        instead of waiting for the whole utterance.
+        """
+        if time.monotonic() < self._tts_unhealthy_until:
+            # TTS recently failed; skip synthesis until the cooldown ends
+            console.print(Text(text, style="dim"))
+            return
+
         if self.on_speaking:
             self.on_speaking()
-        
-        console.print("[cyan]🔊 बोलत आहे...[/cyan]")
-        
+
+        console.print(_STATUS_SPEAKING)
+
         try:
-            tts_result = await self.tts.synthesize(text, self.language)
-            await self.player.play_bytes_async(tts_result.audio_data, tts_result.format)
+            synthesize_stream = getattr(self.tts, "synthesize_stream", None)
+            if synthesize_stream is None:
+                # One-shot fallback for backends without streaming support
+                tts_result = await self.tts.synthesize(text, self.language)
+                await self.player.play_bytes_async(tts_result.audio_data, tts_result.format)
+                return
+
+            chunk_queue: asyncio.Queue = asyncio.Queue(maxsize=4)
+
+            async def _produce():
+                try:
+                    async for chunk in synthesize_stream(text, self.language):
+                        await chunk_queue.put(chunk)
+                finally:
+                    await chunk_queue.put(None)
+
+            async def _play():
+                while True:
+                    chunk = await chunk_queue.get()
+                    if chunk is None:
+                        break
+                    await self.player.play_bytes_async(chunk.audio_data, chunk.format)
+
+            await asyncio.gather(_produce(), _play())
         except Exception as e:
             console.print(f"[yellow]TTS Error: {e}[/yellow]")
+            self._tts_unhealthy_until = time.monotonic() + self._TTS_COOLDOWN
     
+    async def _speak_farewell(self):
+        """Play the pre-synthesized farewell, synthesizing on demand if needed"""
+        if self._farewell_result is None and self._farewell_task is not None:
+            try:
+                self._farewell_result = await self._farewell_task
+            except Exception:
+                self._farewell_result = None
+            self._farewell_task = None
+
+        if self._farewell_result is not None:
+            try:
+                await self.player.play_bytes_async(
+                    self._farewell_result.audio_data,
+                    self._farewell_result.format
+                )
+                return
+            except Exception as e:
+                console.print(f"[yellow]TTS Error: {e}[/yellow]")
+                return
+
+        await self._speak(_FAREWELL)
+
     async def run_interactive_loop(self):
         """Run the main interactive voice loop"""
+        await self.setup()
+
         self.is_running = True
         self.start_session()
         
         # Greeting
         greeting = self._get_greeting()
-        console.print(Panel(
-            f"[green]{greeting}[/green]",
-            title="🙏 स्वागत / Welcome",
-            border_style="green"
-        ))
+        console.print(_greeting_panel(self.language, greeting))
         await self._speak(greeting)
         
         while self.is_running:
@@ -294,10 +553,9 @@ class VoiceInterface:
                 
                 # Check for exit commands
                 user_text = result.get("user_text", "").lower()
-                if any(word in user_text for word in ["बंद करा", "थांबा", "exit", "quit", "बाय"]):
-                    farewell = "धन्यवाद! तुमचा दिवस शुभ जावो."
-                    console.print(f"\n[green]{farewell}[/green]")
-                    await self._speak(farewell)
+                if _EXIT_RE.search(user_text):
+                    console.print(_FAREWELL_TEXT)
+                    await self._speak_farewell()
                     self.is_running = False
                     break
                 
@@ -314,14 +572,7 @@ class VoiceInterface:
     
     def _get_greeting(self) -> str:
         """Get greeting message in current language"""
-        greetings = {
-            "marathi": "नमस्कार! मी तुमचा सरकारी योजना सहाय्यक आहे. मी तुम्हाला योग्य योजना शोधण्यात आणि अर्ज करण्यात मदत करतो. तुम्हाला कोणत्या प्रकारच्या योजनेची माहिती हवी आहे?",
-            "hindi": "नमस्ते! मैं आपका सरकारी योजना सहायक हूं। मैं आपको सही योजना खोजने और आवेदन करने में मदद करता हूं। आपको किस प्रकार की योजना की जानकारी चाहिए?",
-            "telugu": "నమస్కారం! నేను మీ ప్రభుత్వ పథకాల సహాయకుడిని. మీకు సరైన పథకాన్ని కనుగొని దరఖాస్తు చేయడంలో సహాయపడతాను. మీకు ఏ రకమైన పథకం గురించి సమాచారం కావాలి?",
-            "tamil": "வணக்கம்! நான் உங்கள் அரசு திட்ட உதவியாளர். சரியான திட்டத்தைக் கண்டறிந்து விண்ணப்பிக்க உதவுகிறேன். எந்த வகையான திட்டம் பற்றிய தகவல் வேண்டும்?",
-            "bengali": "নমস্কার! আমি আপনার সরকারি প্রকল্প সহায়ক। আমি আপনাকে সঠিক প্রকল্প খুঁজে বের করতে এবং আবেদন করতে সাহায্য করি। আপনার কোন ধরনের প্রকল্পের তথ্য দরকার?"
-        }
-        return greetings.get(self.language, greetings["hindi"])
+        return _GREETINGS.get(self.language, _GREETINGS["hindi"])
     
     def get_agent_state(self) -> AgentState:
         """Get current agent state"""
@@ -341,6 +592,7 @@ class VoiceInterface:
             self.agent.end_session(self.current_session_id)
             self.memory_manager.end_session(self.current_session_id)
             self.current_session_id = None
+            self._session = None
         self.is_running = False
 
 
@@ -362,16 +614,27 @@ async def main():
     console.print("4. தமிழ் (Tamil)")
     console.print("5. বাংলা (Bengali)")
     
+    # Warm the voice backends while the user reads the menu; the factories
+    # memoize their result, so interface.setup() below reuses these
+    # instances instantly.
+    async def _prewarm():
+        try:
+            await asyncio.gather(
+                asyncio.to_thread(STTFactory.get_best_available),
+                asyncio.to_thread(TTSFactory.get_best_available),
+            )
+        except Exception:
+            pass  # Probe errors will surface again in setup()
+
+    prewarm_task = asyncio.create_task(_prewarm())
+
     try:
-        choice = input("\nEnter choice (1-5) [default: 1]: ").strip() or "1"
-        languages = {
-            "1": "marathi",
-            "2": "hindi",
-            "3": "telugu",
-            "4": "tamil",
-            "5": "bengali"
-        }
-        language = languages.get(choice, "marathi")
+        # input() runs in a worker thread so the prewarm above keeps
+        # making progress while the user reads
+        choice = (await asyncio.to_thread(
+            input, "\nEnter choice (1-5) [default: 1]: "
+        )).strip() or "1"
+        language = _LANGUAGE_CHOICES.get(choice, "marathi")
     except:
         language = "marathi"
     
@@ -379,6 +642,8 @@ async def main():
     
     # Create and run interface
     interface = VoiceInterface(language=language)
+    await prewarm_task
+    await interface.setup()
     
     try:
         await interface.run_interactive_loop()
@@ -389,4 +654,7 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Must run before asyncio.run() creates the loop; uvloop cuts the
+    # per-await overhead that dominates VAD-frame and HTTP-chunk handling.
+    LLMClientFactory.install_fast_event_loop()
     asyncio.run(main())
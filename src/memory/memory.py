@@ -3,14 +3,64 @@ Memory System
 Handles conversation memory, context persistence, and contradiction detection
 """
 import json
-from typing import Dict, Any, List, Optional, Tuple
-from datetime import datetime, timedelta
+import sys
+import time
+from typing import Dict, Any, List, Mapping, Optional, Tuple
+from datetime import datetime
 from dataclasses import dataclass, field
-from collections import defaultdict
-import hashlib
+from collections import ChainMap, deque
+from itertools import islice
+import heapq
 
+try:
+    # C-accelerated ISO-8601 parsing; large session files rehydrate one
+    # timestamp per turn, where the stdlib parser dominates.
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:  # optional; stdlib fromisoformat handles our own output
+    _parse_datetime = datetime.fromisoformat
 
-@dataclass
+try:
+    # Session files grow with conversation length; orjson serializes and
+    # parses them several times faster than the stdlib encoder.
+    import orjson
+
+    def _dump_session(data: Dict[str, Any], filepath: str):
+        with open(filepath, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+    def _load_session(filepath: str) -> Dict[str, Any]:
+        with open(filepath, "rb") as f:
+            return orjson.loads(f.read())
+
+    def _dump_jsonl_line(data: Dict[str, Any]) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dump_session(data: Dict[str, Any], filepath: str):
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+    def _load_session(filepath: str) -> Dict[str, Any]:
+        with open(filepath, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _dump_jsonl_line(data: Dict[str, Any]) -> bytes:
+        return (json.dumps(data, ensure_ascii=False) + "\n").encode("utf-8")
+
+    _loads = json.loads
+
+
+# Display labels for conversation roles, resolved once per turn render
+_ROLE_LABELS = {"user": "User", "assistant": "Assistant"}
+
+# %-templates hit CPython's two-str fast path; these run once per turn
+# on every context assembly
+_CTX_TPL = "%s: %s"
+_SUM_TPL = "[Previous conversation summary: %s]"
+
+
+@dataclass(slots=True)
 class MemoryEntry:
     """Single memory entry"""
     key: str
@@ -19,19 +69,28 @@ class MemoryEntry:
     timestamp: datetime
     confidence: float = 1.0
     metadata: Dict[str, Any] = field(default_factory=dict)
-    
+    # ISO string formatted once; timestamps never change after creation,
+    # and to_dict runs repeatedly on the context-assembly path
+    _iso: str = field(init=False, repr=False, default="")
+
+    def __post_init__(self):
+        # Sources come from a small fixed vocabulary; interning shares
+        # one copy across entries and makes comparisons pointer checks
+        self.source = sys.intern(self.source)
+        self._iso = self.timestamp.isoformat()
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "key": self.key,
             "value": self.value,
             "source": self.source,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self._iso,
             "confidence": self.confidence,
             "metadata": self.metadata
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationTurn:
     """Single conversation turn"""
     role: str  # "user" or "assistant"
@@ -40,12 +99,20 @@ class ConversationTurn:
     audio_confidence: float = 1.0
     entities_extracted: Dict[str, Any] = field(default_factory=dict)
     tool_calls: List[str] = field(default_factory=list)
-    
+    # See MemoryEntry._iso: formatted once, reused by every to_dict
+    _iso: str = field(init=False, repr=False, default="")
+
+    def __post_init__(self):
+        # See MemoryEntry: roles are "user"/"assistant", shared across
+        # every turn including ones rehydrated from JSON
+        self.role = sys.intern(self.role)
+        self._iso = self.timestamp.isoformat()
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "role": self.role,
             "content": self.content,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self._iso,
             "audio_confidence": self.audio_confidence,
             "entities_extracted": self.entities_extracted,
             "tool_calls": self.tool_calls
@@ -59,22 +126,27 @@ class ConversationMemory:
     """
     
     def __init__(self, max_turns: int = 20, summarize_after: int = 10):
-        self.turns: List[ConversationTurn] = []
+        # deque gives O(1) eviction from the left when old turns are
+        # summarized away; a list shifts every remaining element
+        self.turns: deque[ConversationTurn] = deque()
         self.max_turns = max_turns
         self.summarize_after = summarize_after
-        self.summaries: List[str] = []
+        # Only the latest summary is ever surfaced; keep a short tail
+        # instead of accumulating one string per summarization forever
+        self.summaries: deque[str] = deque(maxlen=4)
     
     def add_turn(self, 
                  role: str, 
                  content: str,
                  audio_confidence: float = 1.0,
                  entities: Optional[Dict[str, Any]] = None,
-                 tool_calls: Optional[List[str]] = None):
+                 tool_calls: Optional[List[str]] = None,
+                 now: Optional[datetime] = None):
         """Add a conversation turn"""
         turn = ConversationTurn(
             role=role,
             content=content,
-            timestamp=datetime.now(),
+            timestamp=now or datetime.now(),
             audio_confidence=audio_confidence,
             entities_extracted=entities or {},
             tool_calls=tool_calls or []
@@ -88,56 +160,62 @@ class ConversationMemory:
     
     def get_recent_turns(self, n: int = 10) -> List[Dict[str, Any]]:
         """Get last n turns"""
-        return [t.to_dict() for t in self.turns[-n:]]
+        start = max(0, len(self.turns) - n)
+        return [t.to_dict() for t in islice(self.turns, start, None)]
     
     def get_context_string(self, n: int = 5) -> str:
         """Get formatted conversation context"""
-        context_parts = []
+        recent = (
+            _CTX_TPL % (_ROLE_LABELS.get(turn.role, "Assistant"), turn.content)
+            for turn in islice(self.turns, max(0, len(self.turns) - n), None)
+        )
+        body = "\n".join(recent)
         
         # Include summary if available
         if self.summaries:
-            context_parts.append(f"[Previous conversation summary: {self.summaries[-1]}]")
+            summary = _SUM_TPL % self.summaries[-1]
+            return summary + "\n" + body if body else summary
         
-        # Include recent turns
-        for turn in self.turns[-n:]:
-            role_label = "User" if turn.role == "user" else "Assistant"
-            context_parts.append(f"{role_label}: {turn.content}")
-        
-        return "\n".join(context_parts)
+        return body
     
     def _summarize_old_turns(self):
         """Summarize older turns to maintain context window"""
         # Keep only recent turns
-        turns_to_summarize = self.turns[:-self.summarize_after]
-        self.turns = self.turns[-self.summarize_after:]
+        turns_to_summarize = []
+        while len(self.turns) > self.summarize_after:
+            turns_to_summarize.append(self.turns.popleft())
         
         # Create simple summary
-        summary_parts = []
-        for turn in turns_to_summarize:
-            if turn.role == "user":
-                summary_parts.append(f"User asked about: {turn.content[:50]}...")
-            if turn.entities_extracted:
-                summary_parts.append(f"Extracted: {list(turn.entities_extracted.keys())}")
+        def _parts():
+            for turn in turns_to_summarize:
+                if turn.role == "user":
+                    yield f"User asked about: {turn.content[:50]}..."
+                if turn.entities_extracted:
+                    yield f"Extracted: {list(turn.entities_extracted)}"
         
-        if summary_parts:
-            self.summaries.append(" | ".join(summary_parts))
+        summary = " | ".join(_parts())
+        if summary:
+            self.summaries.append(summary)
     
-    def get_all_entities(self) -> Dict[str, Any]:
-        """Get all extracted entities from conversation"""
-        all_entities = {}
-        for turn in self.turns:
-            all_entities.update(turn.entities_extracted)
-        return all_entities
+    def get_all_entities(self) -> Mapping[str, Any]:
+        """Get all extracted entities from conversation.
+
+        Returns a ChainMap view over the per-turn entity dicts, newest
+        first, so lookups see the latest value for each key without
+        materializing a merged dict. Wrap in dict() if a real copy is
+        needed.
+        """
+        return ChainMap(*(t.entities_extracted for t in reversed(self.turns)))
     
     def clear(self):
         """Clear conversation history"""
-        self.turns = []
-        self.summaries = []
+        self.turns.clear()
+        self.summaries.clear()
     
     def to_dict(self) -> Dict[str, Any]:
         return {
             "turns": [t.to_dict() for t in self.turns],
-            "summaries": self.summaries
+            "summaries": list(self.summaries)
         }
 
 
@@ -147,17 +225,27 @@ class UserProfileMemory:
     Supports contradiction detection and resolution
     """
     
+    # History depth kept per key; contradiction checks only need the
+    # latest entry, so older revisions exist purely for inspection
+    _HISTORY_DEPTH = 8
+
     def __init__(self):
-        self.entries: Dict[str, List[MemoryEntry]] = defaultdict(list)
-        self.contradictions: List[Dict[str, Any]] = []
+        self.entries: Dict[str, deque] = {}
+        # Keyed by profile key: only the latest unresolved conflict per
+        # field matters, and confirm_value can drop it in one pop
+        self.contradictions: Dict[str, Dict[str, Any]] = {}
         self.confirmed_values: Dict[str, Any] = {}
+        # Current value per key, maintained incrementally on writes so
+        # summary reads don't rescan entry history every turn
+        self._summary_cache: Dict[str, Any] = {}
     
     def set(self, 
             key: str, 
             value: Any, 
             source: str = "user",
             confidence: float = 1.0,
-            metadata: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+            metadata: Optional[Dict[str, Any]] = None,
+            now: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
         """
         Set a profile value
         Returns contradiction info if detected
@@ -166,15 +254,16 @@ class UserProfileMemory:
             key=key,
             value=value,
             source=source,
-            timestamp=datetime.now(),
+            timestamp=now or datetime.now(),
             confidence=confidence,
             metadata=metadata or {}
         )
         
         # Check for contradiction
         contradiction = None
-        if key in self.entries and self.entries[key]:
-            last_entry = self.entries[key][-1]
+        history = self.entries.get(key)
+        if history:
+            last_entry = history[-1]
             
             # Check if value is different
             if last_entry.value != value:
@@ -184,13 +273,16 @@ class UserProfileMemory:
                         "key": key,
                         "old_value": last_entry.value,
                         "old_source": last_entry.source,
-                        "old_timestamp": last_entry.timestamp.isoformat(),
+                        "old_timestamp": last_entry._iso,
                         "new_value": value,
                         "new_source": source
                     }
-                    self.contradictions.append(contradiction)
-        
-        self.entries[key].append(entry)
+                    self.contradictions[key] = contradiction
+            history.append(entry)
+        else:
+            self.entries[key] = deque((entry,), maxlen=self._HISTORY_DEPTH)
+        if key not in self.confirmed_values and value is not None:
+            self._summary_cache[key] = value
         
         return contradiction
     
@@ -200,6 +292,9 @@ class UserProfileMemory:
         if key in self.confirmed_values:
             return self.confirmed_values[key]
         
+        if key in self._summary_cache:
+            return self._summary_cache[key]
+        
         # Get latest entry
         if key in self.entries and self.entries[key]:
             return self.entries[key][-1].value
@@ -207,12 +302,13 @@ class UserProfileMemory:
         return None
     
     def get_with_history(self, key: str) -> List[MemoryEntry]:
-        """Get all values for a key with history"""
-        return self.entries.get(key, [])
+        """Get retained values for a key, oldest first"""
+        return list(self.entries.get(key, ()))
     
     def confirm_value(self, key: str, value: Any):
         """Confirm a value after contradiction resolution"""
         self.confirmed_values[key] = value
+        self._summary_cache[key] = value
         
         # Add as new entry with high confidence
         self.set(
@@ -224,26 +320,18 @@ class UserProfileMemory:
         )
         
         # Remove from contradictions
-        self.contradictions = [
-            c for c in self.contradictions 
-            if c["key"] != key
-        ]
+        self.contradictions.pop(key, None)
     
     def get_pending_contradictions(self) -> List[Dict[str, Any]]:
         """Get unresolved contradictions"""
         return [
-            c for c in self.contradictions
-            if c["key"] not in self.confirmed_values
+            c for key, c in self.contradictions.items()
+            if key not in self.confirmed_values
         ]
     
     def get_profile_summary(self) -> Dict[str, Any]:
         """Get current profile as dictionary"""
-        profile = {}
-        for key in self.entries:
-            value = self.get(key)
-            if value is not None:
-                profile[key] = value
-        return profile
+        return dict(self._summary_cache)
     
     def get_missing_fields(self, required_fields: List[str]) -> List[str]:
         """Get list of missing required fields"""
@@ -252,7 +340,7 @@ class UserProfileMemory:
     def to_dict(self) -> Dict[str, Any]:
         return {
             "profile": self.get_profile_summary(),
-            "contradictions": self.contradictions,
+            "contradictions": list(self.contradictions.values()),
             "confirmed_values": self.confirmed_values
         }
 
@@ -268,70 +356,97 @@ class SessionMemory:
         self.language = language
         self.conversation = ConversationMemory()
         self.profile = UserProfileMemory()
-        self.tool_results: List[Dict[str, Any]] = []
-        self.created_at = datetime.now()
-        self.last_activity = datetime.now()
+        # Sliding window, same rationale as conversation turns: only the
+        # recent tail is ever read, and saves shouldn't grow unbounded
+        self.tool_results: deque = deque(maxlen=32)
+        # Epoch floats: activity checks and duration math are plain
+        # float subtractions instead of datetime/timedelta arithmetic;
+        # conversion to ISO happens only at serialization boundaries
+        self.created_at = time.time()
+        self.last_activity = time.time()
         self.current_goal: Optional[str] = None
         self.context_stack: List[str] = []
+        # Full-context snapshot, invalidated by the mutators below; the
+        # agent assembles context several times per turn between writes
+        self._context_cache: Optional[Dict[str, Any]] = None
     
     def add_user_message(self, 
                          content: str, 
                          audio_confidence: float = 1.0,
                          entities: Optional[Dict[str, Any]] = None):
         """Add user message and extract entities"""
+        # One datetime.now() shared across the turn, every entity write
+        # and the activity stamp
+        now = datetime.now()
         self.conversation.add_turn(
             role="user",
             content=content,
             audio_confidence=audio_confidence,
-            entities=entities
+            entities=entities,
+            now=now
         )
         
         # Update profile with extracted entities
         if entities:
             for key, value in entities.items():
                 if value is not None:
-                    self.profile.set(key, value, source="extracted")
+                    self.profile.set(key, value, source="extracted", now=now)
         
-        self.last_activity = datetime.now()
+        self.last_activity = now.timestamp()
+        self._context_cache = None
     
     def add_assistant_message(self, 
                               content: str,
                               tool_calls: Optional[List[str]] = None):
         """Add assistant message"""
+        now = datetime.now()
         self.conversation.add_turn(
             role="assistant",
             content=content,
-            tool_calls=tool_calls
+            tool_calls=tool_calls,
+            now=now
         )
-        self.last_activity = datetime.now()
+        self.last_activity = now.timestamp()
+        self._context_cache = None
     
     def add_tool_result(self, tool_name: str, result: Dict[str, Any]):
         """Add tool execution result"""
+        now = datetime.now()
         self.tool_results.append({
             "tool": tool_name,
             "result": result,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now.isoformat()
         })
-        self.last_activity = datetime.now()
+        self.last_activity = now.timestamp()
+        self._context_cache = None
     
     def set_goal(self, goal: str):
         """Set current conversation goal"""
         self.current_goal = goal
         self.context_stack.append(goal)
+        self._context_cache = None
     
     def get_full_context(self) -> Dict[str, Any]:
         """Get complete context for agent"""
-        return {
-            "session_id": self.session_id,
-            "language": self.language,
-            "current_goal": self.current_goal,
-            "user_profile": self.profile.get_profile_summary(),
-            "conversation_context": self.conversation.get_context_string(),
-            "recent_turns": self.conversation.get_recent_turns(5),
-            "pending_contradictions": self.profile.get_pending_contradictions(),
-            "recent_tool_results": self.tool_results[-3:] if self.tool_results else [],
-            "session_duration": (datetime.now() - self.created_at).total_seconds()
-        }
+        if self._context_cache is None:
+            self._context_cache = {
+                "session_id": self.session_id,
+                "language": self.language,
+                "current_goal": self.current_goal,
+                "user_profile": self.profile.get_profile_summary(),
+                "conversation_context": self.conversation.get_context_string(),
+                "recent_turns": self.conversation.get_recent_turns(5),
+                "pending_contradictions": self.profile.get_pending_contradictions(),
+                "recent_tool_results": list(
+                    islice(self.tool_results, max(0, len(self.tool_results) - 3), None)
+                ),
+            }
+        
+        # session_duration is the only time-dependent field; refresh it
+        # on a shallow copy so cached state stays clean
+        context = dict(self._context_cache)
+        context["session_duration"] = time.time() - self.created_at
+        return context
     
     def has_pending_contradictions(self) -> bool:
         """Check if there are unresolved contradictions"""
@@ -343,23 +458,80 @@ class SessionMemory:
             "language": self.language,
             "conversation": self.conversation.to_dict(),
             "profile": self.profile.to_dict(),
-            "tool_results": self.tool_results,
+            "tool_results": list(self.tool_results),
             "current_goal": self.current_goal,
             "context_stack": self.context_stack,
-            "created_at": self.created_at.isoformat(),
-            "last_activity": self.last_activity.isoformat()
+            "created_at": datetime.fromtimestamp(self.created_at).isoformat(),
+            "last_activity": datetime.fromtimestamp(self.last_activity).isoformat()
         }
     
     def save_to_file(self, filepath: str):
         """Save session to file"""
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
-    
+        _dump_session(self.to_dict(), filepath)
+
+    def append_turn_to_log(self, filepath: str):
+        """Append the newest conversation turn to a JSONL log.
+
+        save_to_file rewrites the whole session on every call; for
+        per-turn checkpointing this appends one line instead, so the
+        write cost stays constant as the session grows. Pair with
+        save_snapshot and load_from_log.
+        """
+        if not self.conversation.turns:
+            return
+        with open(filepath, "ab") as f:
+            f.write(_dump_jsonl_line(self.conversation.turns[-1].to_dict()))
+
+    def save_snapshot(self, filepath: str):
+        """Save everything except the turn log (see append_turn_to_log)"""
+        _dump_session({
+            "session_id": self.session_id,
+            "language": self.language,
+            "summaries": list(self.conversation.summaries),
+            "profile": self.profile.to_dict(),
+            "tool_results": list(self.tool_results),
+            "current_goal": self.current_goal,
+            "context_stack": self.context_stack,
+            "created_at": datetime.fromtimestamp(self.created_at).isoformat(),
+            "last_activity": datetime.fromtimestamp(self.last_activity).isoformat()
+        }, filepath)
+
+    @classmethod
+    def load_from_log(cls, snapshot_filepath: str, log_filepath: str) -> 'SessionMemory':
+        """Restore a session from a snapshot plus its JSONL turn log"""
+        data = _load_session(snapshot_filepath)
+        
+        session = cls(data["session_id"], data["language"])
+        session.conversation.summaries.extend(data.get("summaries", []))
+        
+        with open(log_filepath, "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                turn_data = _loads(line)
+                session.conversation.turns.append(ConversationTurn(
+                    role=turn_data["role"],
+                    content=turn_data["content"],
+                    timestamp=_parse_datetime(turn_data["timestamp"]),
+                    audio_confidence=turn_data.get("audio_confidence", 1.0),
+                    entities_extracted=turn_data.get("entities_extracted", {}),
+                    tool_calls=turn_data.get("tool_calls", [])
+                ))
+        
+        profile_data = data.get("profile", {}).get("profile", {})
+        for key, value in profile_data.items():
+            session.profile.set(key, value, source="restored")
+        
+        session.tool_results = deque(data.get("tool_results", []), maxlen=32)
+        session.current_goal = data.get("current_goal")
+        session.context_stack = data.get("context_stack", [])
+        
+        return session
+
     @classmethod
     def load_from_file(cls, filepath: str) -> 'SessionMemory':
         """Load session from file"""
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _load_session(filepath)
         
         session = cls(data["session_id"], data["language"])
         
@@ -368,7 +540,7 @@ class SessionMemory:
             session.conversation.turns.append(ConversationTurn(
                 role=turn_data["role"],
                 content=turn_data["content"],
-                timestamp=datetime.fromisoformat(turn_data["timestamp"]),
+                timestamp=_parse_datetime(turn_data["timestamp"]),
                 audio_confidence=turn_data.get("audio_confidence", 1.0),
                 entities_extracted=turn_data.get("entities_extracted", {}),
                 tool_calls=turn_data.get("tool_calls", [])
@@ -379,7 +551,7 @@ class SessionMemory:
         for key, value in profile_data.items():
             session.profile.set(key, value, source="restored")
         
-        session.tool_results = data.get("tool_results", [])
+        session.tool_results = deque(data.get("tool_results", []), maxlen=32)
         session.current_goal = data.get("current_goal")
         session.context_stack = data.get("context_stack", [])
         
@@ -395,7 +567,7 @@ class MemoryManager:
     def __init__(self, max_sessions: int = 100, session_timeout_hours: int = 24):
         self.sessions: Dict[str, SessionMemory] = {}
         self.max_sessions = max_sessions
-        self.session_timeout = timedelta(hours=session_timeout_hours)
+        self.session_timeout_secs = session_timeout_hours * 3600
     
     def create_session(self, session_id: str, language: str = "marathi") -> SessionMemory:
         """Create new session"""
@@ -412,7 +584,7 @@ class MemoryManager:
         session = self.sessions.get(session_id)
         if session:
             # Check if expired
-            if datetime.now() - session.last_activity > self.session_timeout:
+            if time.time() - session.last_activity > self.session_timeout_secs:
                 del self.sessions[session_id]
                 return None
         return session
@@ -433,22 +605,27 @@ class MemoryManager:
     
     def _cleanup_old_sessions(self):
         """Remove expired sessions"""
-        now = datetime.now()
+        # One subtraction up front; comparing against the cutoff avoids
+        # per-session arithmetic
+        cutoff = time.time() - self.session_timeout_secs
         expired = [
             sid for sid, session in self.sessions.items()
-            if now - session.last_activity > self.session_timeout
+            if session.last_activity < cutoff
         ]
         for sid in expired:
-            del self.sessions[sid]
+            self.sessions.pop(sid, None)
         
-        # If still too many, remove oldest
+        # If still too many, remove the oldest half. nsmallest only
+        # tracks the k eviction candidates instead of sorting every
+        # session by last_activity.
         if len(self.sessions) >= self.max_sessions:
-            sorted_sessions = sorted(
+            oldest = heapq.nsmallest(
+                len(self.sessions) // 2,
                 self.sessions.items(),
                 key=lambda x: x[1].last_activity
             )
-            for sid, _ in sorted_sessions[:len(sorted_sessions)//2]:
-                del self.sessions[sid]
+            for sid, _ in oldest:
+                self.sessions.pop(sid, None)
     
     def get_all_session_ids(self) -> List[str]:
         """Get all active session IDs"""
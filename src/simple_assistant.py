@@ -12,13 +12,32 @@ This intentionally avoids the multi-agent planner/executor loop for stability.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional, Tuple, List
+from typing import Any, Dict, Final, Optional, Set, Tuple, List
 import re
+import sys
 import difflib
 import unicodedata
+from functools import lru_cache
 
 from .tools.retrieval import SchemeRetriever, ApplicationHelper
 
+try:
+    # Aho-Corasick automaton: one pass over the text instead of one
+    # substring scan per category keyword.
+    import ahocorasick as _ahocorasick
+except ImportError:  # optional; a compiled alternation stands in
+    _ahocorasick = None
+
+try:
+    # C++ bit-parallel Levenshtein; an order of magnitude faster than
+    # difflib's pure-Python Ratcliff/Obershelp on the lookup hot path.
+    from rapidfuzz import fuzz as _rf_fuzz, process as _rf_process
+    from rapidfuzz.distance import Levenshtein as _rf_levenshtein
+except ImportError:  # optional; difflib keeps fuzzy matching working
+    _rf_fuzz = None
+    _rf_process = None
+    _rf_levenshtein = None
+
 
 # Deterministic translations for the small local dataset (10 schemes).
 TA_DOCS: Dict[str, str] = {
@@ -93,6 +112,69 @@ TA_SCHEME_NAMES: Dict[str, str] = {
 }
 
 
+# Compiled once at import: these run on every turn, and string-pattern
+# re.sub/re.search pay a compile-cache probe per call.
+_RE_WS = re.compile(r"\s+")
+_RE_AVAS_C = re.compile(r"ஆவாச்?")
+# Bare "ஆவாஸ" without the virama; the lookahead keeps an already-correct
+# "ஆவாஸ்" from gaining a second virama.
+_RE_AVAS_BARE = re.compile(r"ஆவாஸ(?!்)")
+_RE_KISAN = re.compile(r"கிசன")
+_RE_SAMAN = re.compile(r"சமான்")
+
+# Tamil letter-name tokens for acronym rewriting (see
+# _rewrite_phonetic_acronyms). STT may drop vowel/virama marks, so each
+# token matches both marked and unmarked variants.
+_P_TOK = r"ப(?:ி|ீ)?"  # P
+_M_TOK = r"(?:எ(?:ம்|ம)?|ய(?:ம்|ம)?)"  # M (எம்/எம/யம்/யம)
+# Whisper sometimes mis-hears the letter 'A' as Tamil 'ய' in this context.
+_A_TOK = r"(?:ஏ|எ|அ|ஆ|ய)"  # A
+_Y_TOK = r"(?:வ(?:ை)?|ய்|ஐ)"  # Y
+_KISAN_TOK = r"க(?:ி)?ச(?:ா)?ன(?:்)?"  # kisan may also lose marks
+
+# All acronym rewrites fused into one alternation so a single sub pass
+# replaces every occurrence. Token boundaries are zero-width lookarounds
+# (rather than consumed whitespace) so adjacent acronyms both match; the
+# trailing whitespace collapse normalizes the padding either way.
+_ACRONYM_PATTERNS: Tuple[Tuple[str, str], ...] = (
+    # PMAY (Pradhan Mantri Awas Yojana) from Tamil letter names
+    (rf"(?<!\S){_P_TOK}\s+{_M_TOK}\s+{_A_TOK}\s+{_Y_TOK}(?!\S)", " pmay "),
+    (rf"(?<!\S){_P_TOK}{_M_TOK}{_A_TOK}{_Y_TOK}(?!\S)", " pmay "),
+    # PM-KISAN from Tamil letter names
+    (rf"(?<!\S){_P_TOK}\s+{_M_TOK}\s+{_KISAN_TOK}(?!\S)", " pm kisan "),
+    (rf"(?<!\S){_P_TOK}{_M_TOK}\s*{_KISAN_TOK}(?!\S)", " pm kisan "),
+    (rf"(?<!\S){_P_TOK}{_M_TOK}\s*{_KISAN_TOK}\s*(?:திட்டம்|யோஜனா|யோஜன)(?!\S)", " pm kisan "),
+    # English letter spellings Whisper may output: "P-M-E-Y", "PMEY", etc.
+    (r"(?<!\S)p\s*[- ]?\s*m\s*[- ]?\s*(?:a|e)\s*[- ]?\s*y(?!\S)", " pmay "),
+    (r"(?<!\S)pm(?:a|e)y(?!\S)", " pmay "),
+    (r"(?<!\S)p\s*[- ]?\s*m\s*[- ]?\s*k\s*[- ]?\s*i\s*[- ]?\s*s\s*[- ]?\s*a\s*[- ]?\s*n(?!\S)", " pm kisan "),
+    (r"(?<!\S)pmkisan(?!\S)", " pm kisan "),
+)
+
+_ACRONYM_RE = re.compile(
+    "|".join(f"(?P<g{i}>{pat})" for i, (pat, _) in enumerate(_ACRONYM_PATTERNS))
+)
+_ACRONYM_REPLACEMENTS: Tuple[str, ...] = tuple(repl for _, repl in _ACRONYM_PATTERNS)
+
+
+def _acronym_repl(m: re.Match) -> str:
+    return _ACRONYM_REPLACEMENTS[m.lastindex - 1]
+
+
+# Normalized Tamil scheme names, computed once: _lookup_scheme matches
+# every query against all of them.
+_TA_SCHEME_NAMES_NORM: Dict[str, str] = {}
+
+
+def _ta_names_norm() -> Dict[str, str]:
+    if not _TA_SCHEME_NAMES_NORM:
+        for sid, name in TA_SCHEME_NAMES.items():
+            target = _norm(name)
+            if target:
+                _TA_SCHEME_NAMES_NORM[sid] = target
+    return _TA_SCHEME_NAMES_NORM
+
+
 def _scheme_display_name(scheme: Dict[str, Any], lang: str) -> str:
     sid = str(scheme.get("id") or "").strip()
     name_en = str(scheme.get("name_en") or scheme.get("name") or "Scheme").strip()
@@ -116,14 +198,14 @@ def _ta_query_canonicalize(text: str) -> str:
 
     # "ஆவாச்" (ச) vs "ஆவாஸ்" (ஸ) for the housing scheme.
     # Normalize a few close variants into the canonical form used in TA_SCHEME_NAMES.
-    t = re.sub(r"ஆவாச்?", "ஆவாஸ்", t)
-    t = re.sub(r"ஆவாஸ", "ஆவாஸ்", t)
+    t = _RE_AVAS_C.sub("ஆவாஸ்", t)
+    t = _RE_AVAS_BARE.sub("ஆவாஸ்", t)
 
     # Minor variants for kisan phrase.
-    t = re.sub(r"கிசன", "கிசான்", t)
-    t = re.sub(r"சமான்", "சம்மான்", t)
+    t = _RE_KISAN.sub("கிசான்", t)
+    t = _RE_SAMAN.sub("சம்மான்", t)
 
-    t = re.sub(r"\s+", " ", t).strip()
+    t = _RE_WS.sub(" ", t).strip()
     return t
 
 
@@ -184,25 +266,24 @@ EN_BENEFITS: Dict[str, str] = {
 }
 
 
+# One table keyed by (lang, kind): a single tuple hash replaces the
+# if/elif cascade over six dicts in _tr.
+_TRANSLATIONS: Dict[Tuple[str, str], Dict[str, str]] = {
+    ("tamil", "doc"): TA_DOCS,
+    ("tamil", "step"): TA_STEPS,
+    ("tamil", "benefit"): TA_BENEFITS,
+    ("english", "doc"): EN_DOCS,
+    ("english", "step"): EN_STEPS,
+    ("english", "benefit"): EN_BENEFITS,
+}
+_EMPTY_TRANSLATION: Dict[str, str] = {}
+
+
 def _tr(item: str, lang: str, kind: str) -> str:
     item = (item or "").strip()
     if not item:
         return ""
-    if lang == "tamil":
-        if kind == "doc":
-            return TA_DOCS.get(item, "")
-        if kind == "step":
-            return TA_STEPS.get(item, "")
-        if kind == "benefit":
-            return TA_BENEFITS.get(item, "")
-    if lang == "english":
-        if kind == "doc":
-            return EN_DOCS.get(item, "")
-        if kind == "step":
-            return EN_STEPS.get(item, "")
-        if kind == "benefit":
-            return EN_BENEFITS.get(item, "")
-    return ""
+    return _TRANSLATIONS.get((lang, kind), _EMPTY_TRANSLATION).get(item, "")
 
 
 _SUPPORTED_LANGS = {
@@ -211,15 +292,31 @@ _SUPPORTED_LANGS = {
 }
 
 
+# Character-class search runs as a C bitmap scan; the previous any()
+# generators paid two Python-level comparisons per character.
+_TAMIL_RE = re.compile(r"[\u0b80-\u0bff]")
+_DEVA_RE = re.compile(r"[\u0900-\u097f]")
+_RE_LATIN = re.compile(r"[a-z]")
+
+# Bound method references: the script checks run on every turn, and the
+# direct binding skips the attribute lookup on each call.
+_tamil_search: Final = _TAMIL_RE.search
+_deva_search: Final = _DEVA_RE.search
+_latin_search: Final = _RE_LATIN.search
+
+
 def _contains_tamil(text: str) -> bool:
-    return any("\u0b80" <= ch <= "\u0bff" for ch in text)
+    return _tamil_search(text) is not None
 
 
 def _contains_devanagari(text: str) -> bool:
-    return any("\u0900" <= ch <= "\u097f" for ch in text)
+    return _deva_search(text) is not None
 
 
 def _strict_language_ok(text: str, language: str) -> bool:
+    if text.isascii():
+        # ASCII can't contain Tamil or Devanagari; allowed for any language.
+        return bool(text.strip())
     if not text.strip():
         return False
     if language == "tamil":
@@ -231,72 +328,184 @@ def _strict_language_ok(text: str, language: str) -> bool:
     return True
 
 
-def _norm(text: str) -> str:
+# ASCII-only deletion table: English queries and scheme codes are the
+# common case, and 128 entries cover them without the full BMP table.
+_ASCII_DROP: Dict[int, None] = {
+    cp: None for cp in range(128)
+    if not (chr(cp).isalnum() or chr(cp) in " -()" or chr(cp).isspace())
+}
+
+# Deletion table for _norm, built lazily on first use: BMP codepoints
+# that are not letters/marks/numbers, whitespace or "-()" map to None so
+# str.translate drops them in a single C pass.
+_DROP_TABLE: Optional[Dict[int, None]] = None
+
+
+def _build_drop_table() -> Dict[int, None]:
+    global _DROP_TABLE
+    if _DROP_TABLE is None:
+        table: Dict[int, None] = {}
+        for cp in range(0x10000):
+            ch = chr(cp)
+            if ch.isspace() or ch in "-()":
+                continue
+            cat = unicodedata.category(ch)
+            if not cat or cat[0] not in "LMN":
+                table[cp] = None
+        _DROP_TABLE = table
+    return _DROP_TABLE
+
+
+# Common STT spellings of Tamil yes/no folded to the canonical form, so
+# the answer parser resolves them with a set lookup instead of fuzzy
+# scoring. The token boundaries are essential: several variants are
+# prefixes of longer words ("இல்ல" inside "இல்லங்க"), which must stay
+# intact for the vocabulary lookup.
+_TA_FOLDED_VARIANTS: Final = {
+    "ஆமாம்": "ஆம்",
+    "ஆமா": "ஆம்",
+    "ஓம்": "ஆம்",
+    "அம்": "ஆம்",
+    "இல்ல": "இல்லை",
+    "இல்லே": "இல்லை",
+}
+_TA_FOLD_RE = re.compile(
+    r"(?<!\S)(?:"
+    + "|".join(sorted(map(re.escape, _TA_FOLDED_VARIANTS), key=len, reverse=True))
+    + r")(?!\S)"
+)
+
+
+def _fold_ta_repl(m: re.Match) -> str:
+    return _TA_FOLDED_VARIANTS[m.group()]
+
+
+@lru_cache(maxsize=4096)
+def _norm(text: str, fold_tamil: bool = False) -> str:
     """Normalize text for matching.
 
     Important: preserve Indic combining marks (Tamil virama/vowel signs),
     otherwise Tamil tokens like "ஆம்"/"இல்லை" get corrupted.
+
+    With fold_tamil=True, common Tamil yes/no spelling variants are also
+    collapsed to their canonical forms (a separate lru_cache slot, since
+    the flag is part of the cache key).
     """
     t = (text or "").strip().lower()
-    t = re.sub(r"\s+", " ", t)
-
-    kept: List[str] = []
-    for ch in t:
-        if ch.isspace() or ch in "-()":
-            kept.append(ch)
-            continue
-        cat = unicodedata.category(ch)
-        # Letters/Marks/Numbers only (drops punctuation/symbols).
-        if cat and cat[0] in {"L", "M", "N"}:
-            kept.append(ch)
-            continue
-        # Drop everything else
-
-    t = "".join(kept)
-    t = re.sub(r"\s+", " ", t).strip()
+    t = _RE_WS.sub(" ", t)
+    if t.isascii():
+        t = t.translate(_ASCII_DROP)
+        return _RE_WS.sub(" ", t).strip()
+    t = t.translate(_build_drop_table())
+    if t and max(t) > "\uffff":
+        # Astral-plane codepoints (emoji etc.) aren't in the table;
+        # filter the rare stragglers with the category check.
+        t = "".join(
+            ch for ch in t
+            if ord(ch) < 0x10000 or unicodedata.category(ch)[0] in "LMN"
+        )
+    t = _RE_WS.sub(" ", t).strip()
+    if fold_tamil:
+        t = _TA_FOLD_RE.sub(_fold_ta_repl, t)
     return t
 
 
-def _is_greeting(text: str) -> bool:
-    t = _norm(text)
-    return t in {"hi", "hello", "hey", "hai", "vanakkam", "வணக்கம்", "namaste", "नमस्ते"}
+_GREETING_WORDS: Final = frozenset({"hi", "hello", "hey", "hai", "vanakkam", "வணக்கம்", "namaste", "नमस्ते"})
 
+# Keep this Tamil-first; allow a few common phonetic spellings from STT.
+_THANKS_WORDS: Final = frozenset({
+    "நன்றி",
+    "நன்ரி",
+    "நன்றி.",
+    "நன்றிங்க",
+    "நன்றீ",
+    "நன்ற",
+})
 
-def _is_thanks(text: str) -> bool:
-    t = _norm(text)
-    # Keep this Tamil-first; allow a few common phonetic spellings from STT.
-    return t in {
-        "நன்றி",
-        "நன்ரி",
-        "நன்றி.",
-        "நன்றிங்க",
-        "நன்றீ",
-        "நன்ற",
-    }
-
-
-def _pick_category(text: str) -> Optional[str]:
+
+def _is_greeting(text: str, norm: Optional[str] = None) -> bool:
+    # Exact greetings skip normalization entirely.
+    if text.strip().lower() in _GREETING_WORDS:
+        return True
+    return (norm if norm is not None else _norm(text)) in _GREETING_WORDS
+
+
+def _is_thanks(text: str, norm: Optional[str] = None) -> bool:
+    if text.strip() in _THANKS_WORDS:
+        return True
+    return (norm if norm is not None else _norm(text)) in _THANKS_WORDS
+
+
+# Minimal multilingual keyword mapping. Declaration order is the match
+# priority when a text mentions several categories.
+_CATEGORY_KEYWORDS: Dict[str, List[str]] = {
+    "housing": ["housing", "house", "home", "pmay", "ஆவாஸ்", "ஆவாஸ", "आवास", "घर", "வீடு", "வீட்ட", "வீட்டு"],
+    "agriculture": ["farm", "farmer", "agriculture", "kisan", "pm kisan", "किसान", "शेतकरी", "விவசாய", "விவசாயி", "விவசாயம்"],
+    "health": ["health", "hospital", "medical", "आरोग्य", "चिकित्सा", "மருத்துவ", "மருத்துவமனை", "சுகாத"],
+    "education": ["education", "school", "college", "scholar", "शिक्ष", "கல்வி", "பள்ளி", "கல்லூரி"],
+    "pension": ["pension", "old age", "पेन्शन", "पेंशन", "ஓய்வூதியம்"],
+    "women_welfare": ["women", "mahila", "महिला", "பெண", "மகளிர"],
+    "financial": ["loan", "bank", "finance", "आर्थिक", "கடன்", "வங்கி"],
+    "insurance": ["insurance", "विमा", "காப்பீடு"],
+}
+
+_CAT_PRIORITY: Dict[str, int] = {cat: i for i, cat in enumerate(_CATEGORY_KEYWORDS)}
+_KW_CATEGORY: Dict[str, str] = {}
+for _cat, _kws in _CATEGORY_KEYWORDS.items():
+    for _kw in _kws:
+        _KW_CATEGORY.setdefault(_kw, _cat)
+
+_CAT_AUTOMATON: Any = None
+_CAT_FALLBACK_RE: Optional[re.Pattern] = None
+
+
+def _ensure_category_matcher():
+    global _CAT_AUTOMATON, _CAT_FALLBACK_RE
+    if _ahocorasick is not None:
+        if _CAT_AUTOMATON is None:
+            automaton = _ahocorasick.Automaton()
+            for kw, cat in _KW_CATEGORY.items():
+                automaton.add_word(kw, cat)
+            automaton.make_automaton()
+            _CAT_AUTOMATON = automaton
+    elif _CAT_FALLBACK_RE is None:
+        # Longest-first literal alternation; re compiles this into a
+        # prefix trie, so it's still a single scan over the text.
+        kws = sorted(_KW_CATEGORY, key=len, reverse=True)
+        _CAT_FALLBACK_RE = re.compile("|".join(map(re.escape, kws)))
+
+
+def _scan_categories(text: str) -> Tuple[Optional[str], int]:
+    """Return the highest-priority category mentioned in text (one pass)."""
+    best: Optional[str] = None
+    best_rank = len(_CAT_PRIORITY)
+    if _CAT_AUTOMATON is not None:
+        hits = (cat for _, cat in _CAT_AUTOMATON.iter(text))
+    else:
+        hits = (_KW_CATEGORY[m.group()] for m in _CAT_FALLBACK_RE.finditer(text))
+    for cat in hits:
+        rank = _CAT_PRIORITY[cat]
+        if rank < best_rank:
+            best, best_rank = cat, rank
+            if rank == 0:
+                break
+    return best, best_rank
+
+
+def _pick_category(text: str, norm: Optional[str] = None) -> Optional[str]:
     raw = (text or "").strip().lower()
-    t = _norm(text)
-    # Minimal multilingual keyword mapping.
-    mapping = {
-        "housing": ["housing", "house", "home", "pmay", "ஆவாஸ்", "ஆவாஸ", "आवास", "घर", "வீடு", "வீட்ட", "வீட்டு"],
-        "agriculture": ["farm", "farmer", "agriculture", "kisan", "pm kisan", "किसान", "शेतकरी", "விவசாய", "விவசாயி", "விவசாயம்"],
-        "health": ["health", "hospital", "medical", "आरोग्य", "चिकित्सा", "மருத்துவ", "மருத்துவமனை", "சுகாத"],
-        "education": ["education", "school", "college", "scholar", "शिक्ष", "கல்வி", "பள்ளி", "கல்லூரி"],
-        "pension": ["pension", "old age", "पेन्शन", "पेंशन", "ஓய்வூதியம்"],
-        "women_welfare": ["women", "mahila", "महिला", "பெண", "மகளிர"],
-        "financial": ["loan", "bank", "finance", "आर्थिक", "கடன்", "வங்கி"],
-        "insurance": ["insurance", "विमा", "காப்பீடு"],
-    }
-    for cat, kws in mapping.items():
-        if any(kw in t for kw in kws) or any(kw in raw for kw in kws):
-            return cat
-    return None
-
-
-def _looks_like_scheme_query(text: str) -> bool:
-    t = _norm(text)
+    t = norm if norm is not None else _norm(text)
+    _ensure_category_matcher()
+    best, best_rank = _scan_categories(t)
+    if raw != t and best_rank > 0:
+        raw_best, raw_rank = _scan_categories(raw)
+        if raw_rank < best_rank:
+            best = raw_best
+    return best
+
+
+def _looks_like_scheme_query(text: str, norm: Optional[str] = None) -> bool:
+    t = norm if norm is not None else _norm(text)
     # Short scheme-like inputs ("pm kisan", "pmay", etc.)
     if len(t.split()) <= 4 and any(x in t for x in ["pm", "yojana", "scheme", "kisan", "pmay", "pension"]):
         return True
@@ -306,7 +515,7 @@ def _looks_like_scheme_query(text: str) -> bool:
     return False
 
 
-def _rewrite_phonetic_acronyms(text: str) -> str:
+def _rewrite_phonetic_acronyms(text: str, norm: Optional[str] = None) -> str:
     """Fix common STT outputs where English acronyms are transcribed as Tamil letter names.
 
     Example: "PMAY" may come back as "பி யம ய வை" (or similar). We rewrite these
@@ -319,55 +528,85 @@ def _rewrite_phonetic_acronyms(text: str) -> str:
 
     # Work on a normalized view for robust matching, but apply replacements to the
     # normalized view (not the raw) since we only use it for lookup.
-    t = _norm(raw)
-
-    # Some environments (or STT quirks) may drop Tamil vowel/virama marks.
-    # Match both marked and unmarked variants.
-    p_tok = r"ப(?:ி|ீ)?"  # P
-    m_tok = r"(?:எ(?:ம்|ம)?|ய(?:ம்|ம)?)"  # M (எம்/எம/யம்/யம)
-    # Whisper sometimes mis-hears the letter 'A' as Tamil 'ய' in this context.
-    a_tok = r"(?:ஏ|எ|அ|ஆ|ய)"  # A
-    y_tok = r"(?:வ(?:ை)?|ய்|ஐ)"  # Y
-
-    # PMAY (Pradhan Mantri Awas Yojana)
-    pmay_patterns = [
-        rf"(?:^|\s){p_tok}\s+{m_tok}\s+{a_tok}\s+{y_tok}(?:\s|$)",
-        rf"(?:^|\s){p_tok}{m_tok}{a_tok}{y_tok}(?:\s|$)",
-    ]
-    for pat in pmay_patterns:
-        if re.search(pat, t):
-            t = re.sub(pat, " pmay ", t)
-
-    # PM-KISAN (kisan may also lose marks: கிசான் -> கசன)
-    kisan_tok = r"க(?:ி)?ச(?:ா)?ன(?:்)?"
-    pmkisan_patterns = [
-        rf"(?:^|\s){p_tok}\s+{m_tok}\s+{kisan_tok}(?:\s|$)",
-        rf"(?:^|\s){p_tok}{m_tok}\s*{kisan_tok}(?:\s|$)",
-        rf"(?:^|\s){p_tok}{m_tok}\s*{kisan_tok}\s*(?:திட்டம்|யோஜனா|யோஜன)(?:\s|$)",
-    ]
-    for pat in pmkisan_patterns:
-        if re.search(pat, t):
-            t = re.sub(pat, " pm kisan ", t)
-
-    # English letter spelling variants that Whisper may output.
-    # "P-M-E-Y", "P M E Y", "PMEY" should be treated as "pmay" for matching.
-    if re.search(r"(?:^|\s)p\s*[- ]?\s*m\s*[- ]?\s*(?:a|e)\s*[- ]?\s*y(?:\s|$)", t):
-        t = re.sub(r"(?:^|\s)p\s*[- ]?\s*m\s*[- ]?\s*(?:a|e)\s*[- ]?\s*y(?:\s|$)", " pmay ", t)
-    if re.search(r"(?:^|\s)pm(?:a|e)y(?:\s|$)", t):
-        t = re.sub(r"(?:^|\s)pm(?:a|e)y(?:\s|$)", " pmay ", t)
-
-    # PM-KISAN letter spelling
-    if re.search(r"(?:^|\s)p\s*[- ]?\s*m\s*[- ]?\s*k\s*[- ]?\s*i\s*[- ]?\s*s\s*[- ]?\s*a\s*[- ]?\s*n(?:\s|$)", t):
-        t = re.sub(r"(?:^|\s)p\s*[- ]?\s*m\s*[- ]?\s*k\s*[- ]?\s*i\s*[- ]?\s*s\s*[- ]?\s*a\s*[- ]?\s*n(?:\s|$)", " pm kisan ", t)
-    if re.search(r"(?:^|\s)pmkisan(?:\s|$)", t):
-        t = re.sub(r"(?:^|\s)pmkisan(?:\s|$)", " pm kisan ", t)
+    t = norm if norm is not None else _norm(raw)
+
+    t = _ACRONYM_RE.sub(_acronym_repl, t)
 
     # Compact whitespace
-    t = re.sub(r"\s+", " ", t).strip()
+    t = _RE_WS.sub(" ", t).strip()
     return t or raw
 
 
-@dataclass
+# Yes/no vocabularies for the requirement checklist flow. Frozen at
+# module level: the per-call set literals allocated ~40 strings per
+# answer. The phrase regexes keep the original space-bounded substring
+# semantics in one compiled scan.
+_YES_WORDS: Final = frozenset({
+    "yes", "y", "yeah", "yep", "ok", "okay", "sure",
+    # Tamil yes + common STT variants
+    "ஆம்", "ஆம", "ஆமா", "ஆமாம்",
+    "அம்", "அம்ம", "அம்ம்",
+    "ம்", "ம்ம", "ம்ம்",
+    # Whisper occasionally mishears "ஆம்" as "ஓம்"
+    "ஓம்",
+    "உண்டு", "இருக்கு",
+})
+_NO_WORDS: Final = frozenset({
+    "no", "n", "nope", "not",
+    "இல்லை", "இலல", "இல்ல", "இல்லங்க", "இல்லா",
+    "இல்லே", "இல்லப்பா", "இல்லங்கா",
+})
+
+
+def _phrase_re(words: frozenset) -> re.Pattern:
+    alts = "|".join(map(re.escape, sorted(words, key=len, reverse=True)))
+    return re.compile(r"(?:^|\s)(?:" + alts + r")(?:\s|$)")
+
+
+# Canonical Tamil answers used as fuzzy-match targets for misspelled
+# short replies.
+_YES_FUZZ: Final = ("ஆம்", "ஆமா", "ஆமாம்", "ஓம்", "அம்")
+_NO_FUZZ: Final = ("இல்லை", "இல்ல", "இல்லே")
+
+_YES_PHRASE_RE = _phrase_re(_YES_WORDS)
+_NO_PHRASE_RE = _phrase_re(_NO_WORDS)
+
+
+# Fixed response fragments, keyed by output language ("tamil" or
+# "english"); the formatters previously rebuilt these strings per call.
+_SUGGEST_HEADER = {
+    "tamil": "தொடர்புடைய திட்டங்கள்:",
+    "english": "Relevant schemes I found:",
+}
+_SUGGEST_FOOTER_CAT = {
+    "tamil": "\nஒரு திட்டத்தின் பெயரை பேசிச் சொல்லுங்கள்; அதன் விவரம் + ஆவண சரிபார்ப்பு + விண்ணப்பிப்பு படிகள் தருகிறேன்.",
+    "english": "\nSay the scheme name to get details + requirements check + apply steps.",
+}
+_SUGGEST_FOOTER_NOCAT = {
+    "tamil": "\nஎந்த வகை திட்டம் வேண்டும்? வீடு / விவசாயம் / சுகாதாரம் / கல்வி / ஓய்வூதியம்",
+    "english": "\nWhich category do you need? housing / agriculture / health / education / pension",
+}
+_SCHEME_TITLE = {"tamil": "திட்டம்: %s", "english": "Scheme: %s"}
+_BENEFITS_HEADER = {"tamil": "\nபயன்கள்:", "english": "\nBenefits:"}
+_WEBSITE_LINE = {
+    "tamil": "\nஅதிகாரப்பூர்வ இணையதளம்: %s",
+    "english": "\nOfficial site: %s",
+}
+_INTRO_TRAILER = {
+    "tamil": "\nதேவையான ஆவணங்களை பற்றி சில ஆம்/இல்லை கேள்விகள் கேட்கிறேன். பின்னர் விண்ணப்பிக்கும் படிகள் தருகிறேன்.",
+    "english": "\nI will ask a few Yes/No questions about required documents. After that, I will give the steps to apply.",
+}
+_REQ_QUESTION = {
+    "tamil": "ஆவணம் சரிபார்ப்பு (%d/%d): உங்களிடம் '%s' உள்ளதா? ஆம் அல்லது இல்லை",
+    "english": "Requirement check (%d/%d): Do you have '%s'? Yes / No",
+}
+
+
+def _lang_key(lang: str) -> str:
+    return "tamil" if lang == "tamil" else "english"
+
+
+@dataclass(slots=True)
 class AssistantSession:
     language: str = "tamil"
     last_suggestions: List[Dict[str, Any]] = field(default_factory=list)
@@ -385,9 +624,56 @@ class SimpleSchemeAssistant:
         self.session = AssistantSession(language=language)
         self.retriever = SchemeRetriever(vector_store=None)
         self.application_helper = ApplicationHelper()
+        # Docs/process for the local dataset never change within a
+        # process; one enrichment per scheme id is enough.
+        self._enrich_cache: Dict[str, Dict[str, Any]] = {}
+        # Pre-normalized (id, name, name_en, norm_id, hay, scheme) rows
+        # plus an id map, built once: queries then match against static
+        # strings instead of re-normalizing every field per call.
+        self._scheme_index: List[Tuple[str, str, str, str, str, Dict[str, Any]]] = []
+        self._schemes_by_id: Dict[str, Dict[str, Any]] = {}
+        # Fuzzy-match candidates split into parallel columns so the
+        # scorer gets one ready-made choices list per query.
+        self._fuzzy_choices: List[str] = []
+        self._fuzzy_schemes: List[Dict[str, Any]] = []
+        # Character-trigram inverted index over the name fields: maps
+        # each trigram to the index rows containing it, so the substring
+        # pass only verifies rows that share every query trigram.
+        self._trigram_index: Dict[str, Set[int]] = {}
+        # The local dataset is tiny and static; load it and build the
+        # lookup index up front so the first user turn pays no warm-up
+        # cost mid-conversation.
+        self.retriever._load_schemes()  # type: ignore[attr-defined]
+        self._schemes: Tuple[Dict[str, Any], ...] = tuple(
+            getattr(self.retriever, "_schemes_cache", []) or []
+        )
+        self._ensure_scheme_index()
 
     def set_language(self, language: str):
-        self.session.language = language if language in _SUPPORTED_LANGS else "english"
+        # Interned so repeated comparisons in the dispatch path are
+        # pointer checks rather than character compares.
+        self.session.language = sys.intern(language if language in _SUPPORTED_LANGS else "english")
+
+    def _ensure_scheme_index(self):
+        if self._scheme_index:
+            return
+        for sch in self._schemes:
+            name = _norm(str(sch.get("name", "")))
+            name_en = _norm(str(sch.get("name_en", "")))
+            sid_n = _norm(str(sch.get("id", "")))
+            hay = " ".join((name, name_en, sid_n)).strip()
+            sid = str(sch.get("id") or "").strip()
+            row = len(self._scheme_index)
+            self._scheme_index.append((sid, name, name_en, sid_n, hay, sch))
+            trigrams = self._trigram_index
+            for field_text in (name, name_en, sid_n):
+                for j in range(len(field_text) - 2):
+                    trigrams.setdefault(field_text[j:j + 3], set()).add(row)
+            if sid:
+                self._schemes_by_id[sid] = sch
+            if hay:
+                self._fuzzy_choices.append(hay)
+                self._fuzzy_schemes.append(sch)
 
     def _reset_requirements_flow(self):
         self.session.active_scheme = None
@@ -395,36 +681,32 @@ class SimpleSchemeAssistant:
         self.session.requirement_index = 0
         self.session.requirement_answers = {}
 
-    def _parse_yes_no(self, text: str) -> Optional[bool]:
-        t = _norm(text)
+    def _parse_yes_no(self, text: str, norm: Optional[str] = None) -> Optional[bool]:
+        if norm is not None:
+            t = _TA_FOLD_RE.sub(_fold_ta_repl, norm)
+        else:
+            t = _norm(text, fold_tamil=True)
         # Accept both languages for robustness.
-        yes = {
-            "yes", "y", "yeah", "yep", "ok", "okay", "sure",
-            # Tamil yes + common STT variants
-            "ஆம்", "ஆம", "ஆமா", "ஆமாம்",
-            "அம்", "அம்ம", "அம்ம்",
-            "ம்", "ம்ம", "ம்ம்",
-            # Whisper occasionally mishears "ஆம்" as "ஓம்"
-            "ஓம்",
-            "உண்டு", "இருக்கு",
-        }
-        no = {
-            "no", "n", "nope", "not",
-            "இல்லை", "இலல", "இல்ல", "இல்லங்க", "இல்லா",
-            "இல்லே", "இல்லப்பா", "இல்லங்கா",
-        }
-        if any(word == t for word in yes) or any(f" {word} " in f" {t} " for word in yes):
+        if t in _YES_WORDS:
             return True
-        if any(word == t for word in no) or any(f" {word} " in f" {t} " for word in no):
+        if t in _NO_WORDS:
+            return False
+        if _YES_PHRASE_RE.search(t):
+            return True
+        if _NO_PHRASE_RE.search(t):
             return False
 
         # Conservative fuzzy matching for small spelling mistakes.
         # Only apply to short, single-phrase answers to avoid false positives.
         if t and len(t) <= 6:
-            yes_targets = ["ஆம்", "ஆமா", "ஆமாம்", "ஓம்", "அம்"]
-            no_targets = ["இல்லை", "இல்ல", "இல்லே"]
-            best_yes = max((difflib.SequenceMatcher(None, t, y).ratio() for y in yes_targets), default=0.0)
-            best_no = max((difflib.SequenceMatcher(None, t, n).ratio() for n in no_targets), default=0.0)
+            if _rf_levenshtein is not None:
+                # normalized_similarity already returns a 0..1 score.
+                sim = _rf_levenshtein.normalized_similarity
+                best_yes = max(sim(t, y) for y in _YES_FUZZ)
+                best_no = max(sim(t, n) for n in _NO_FUZZ)
+            else:
+                best_yes = max(difflib.SequenceMatcher(None, t, y).ratio() for y in _YES_FUZZ)
+                best_no = max(difflib.SequenceMatcher(None, t, n).ratio() for n in _NO_FUZZ)
             if best_yes >= 0.72 and best_yes >= best_no + 0.08:
                 return True
             if best_no >= 0.72 and best_no >= best_yes + 0.08:
@@ -441,42 +723,48 @@ class SimpleSchemeAssistant:
             return self._format_apply_steps_after_requirements(self.session.active_scheme)
 
         req = items[idx]
-        lang = self.session.language
-        if lang == "tamil":
-            return f"ஆவணம் சரிபார்ப்பு ({idx+1}/{len(items)}): உங்களிடம் '{req}' உள்ளதா? ஆம் அல்லது இல்லை"
-        return f"Requirement check ({idx+1}/{len(items)}): Do you have '{req}'? Yes / No"
+        return _REQ_QUESTION[_lang_key(self.session.language)] % (idx + 1, len(items), req)
 
     async def handle_text(self, text: str) -> str:
         if not text or not text.strip():
             return self._msg("empty")
 
-        # If the user says thanks, end politely.
-        if self.session.language == "tamil" and _is_thanks(text):
+        # One normalization pass per turn; every helper below reuses it
+        # instead of re-deriving the same string.
+        norm_text = _norm(text)
+
+        # Greeting/thanks first: both resolve in a set lookup, so they
+        # skip the acronym rewrite and script scans entirely.
+        if self.session.language == "tamil" and _is_thanks(text, norm=norm_text):
             self._reset_requirements_flow()
             return "வணக்கம்"
 
+        if _is_greeting(text, norm=norm_text):
+            return self._msg("greet")
+
+        # Whisper may output English acronyms as Tamil letter names (e.g., PMAY).
+        # Rewrite those to English scheme codes for reliable lookup.
+        lookup_text = _rewrite_phonetic_acronyms(text, norm=norm_text)
+        norm_lookup = _norm(lookup_text)
+
         # Tamil-only input guardrail (backstop).
         # If the user input is clearly not Tamil, ask them to speak in Tamil.
         if self.session.language == "tamil":
-            rewritten_check = _rewrite_phonetic_acronyms(text)
-            lowered = (rewritten_check or "").lower()
-            has_latin = bool(re.search(r"[a-z]", lowered))
-            if _contains_devanagari(rewritten_check) or (has_latin and ("pmay" not in lowered) and ("pm kisan" not in lowered) and ("pmkisan" not in lowered)):
+            lowered = (lookup_text or "").lower()
+            has_latin = _latin_search(lowered) is not None
+            if _contains_devanagari(lookup_text) or (has_latin and ("pmay" not in lowered) and ("pm kisan" not in lowered) and ("pmkisan" not in lowered)):
                 return (
                     "தமிழில் மட்டும் பேசுங்கள். "
                     "உதாரணம்: 'பிரதான் மந்திரி ஆவாஸ் யோஜனா' அல்லது 'பிரதான் மந்திரி கிசான் சம்மான் நிதி'."
                 )
 
-        if _is_greeting(text):
-            return self._msg("greet")
-
         # If we are in the requirements checklist flow, only accept yes/no and proceed.
         if self.session.active_scheme and self.session.requirement_items:
             if self.session.language == "tamil" and _is_thanks(text):
                 self._reset_requirements_flow()
                 return "வணக்கம்"
 
-            yn = self._parse_yes_no(text)
+            yn = self._parse_yes_no(text, norm=norm_text)
             if yn is None:
                 return "'ஆம்' அல்லது 'இல்லை' என்று மட்டும் பதிலளிக்கவும்." if self.session.language == "tamil" else "Please reply with Yes or No."
 
@@ -495,11 +783,7 @@ class SimpleSchemeAssistant:
             self._reset_requirements_flow()
             return base
 
-        # Whisper may output English acronyms as Tamil letter names (e.g., PMAY).
-        # Rewrite those to English scheme codes for reliable lookup.
-        lookup_text = _rewrite_phonetic_acronyms(text)
-
-        scheme = await self._lookup_scheme(lookup_text)
+        scheme = await self._lookup_scheme(lookup_text, norm=norm_lookup)
         if scheme is not None:
             enriched = await self._enrich_scheme(scheme)
 
@@ -529,7 +813,7 @@ class SimpleSchemeAssistant:
             return base
 
         # Not a direct scheme match → retrieve suggestions
-        category = _pick_category(lookup_text)
+        category = _pick_category(lookup_text, norm=norm_lookup)
         query = lookup_text
         results = await self.retriever.execute(query=query, category=category, limit=5)
         schemes = results.get("schemes", []) if isinstance(results, dict) else []
@@ -543,10 +827,7 @@ class SimpleSchemeAssistant:
         # If we detected a category but retrieval failed (Tamil queries may not keyword-match),
         # suggest from the local dataset directly.
         if category:
-            if not self.retriever._schemes_loaded:  # type: ignore[attr-defined]
-                self.retriever._load_schemes()  # type: ignore[attr-defined]
-            all_schemes: List[Dict[str, Any]] = list(getattr(self.retriever, "_schemes_cache", []) or [])
-            cat_schemes = [s for s in all_schemes if s.get("category") == category]
+            cat_schemes = [s for s in self._schemes if s.get("category") == category]
             if cat_schemes:
                 base = self._format_suggestions(cat_schemes[:3], category=category)
                 return base
@@ -554,17 +835,13 @@ class SimpleSchemeAssistant:
         # Nothing found
         return self._msg("not_found", raw=True)
 
-    async def _lookup_scheme(self, text: str) -> Optional[Dict[str, Any]]:
-        q = _norm(text)
+    async def _lookup_scheme(self, text: str, norm: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        q = norm if norm is not None else _norm(text)
         if not q:
             return None
 
-        # Load scheme cache
-        if not self.retriever._schemes_loaded:  # type: ignore[attr-defined]
-            self.retriever._load_schemes()  # type: ignore[attr-defined]
-
-        schemes: List[Dict[str, Any]] = list(getattr(self.retriever, "_schemes_cache", []) or [])
-        if not schemes:
+        self._ensure_scheme_index()
+        if not self._scheme_index:
             return None
 
         # Tamil-first matching: the local dataset names are Marathi/English,
@@ -572,62 +849,83 @@ class SimpleSchemeAssistant:
         if self.session.language == "tamil":
             q_ta = _ta_query_canonicalize(text)
             if q_ta:
-                schemes_by_id = {str(s.get("id") or "").strip(): s for s in schemes}
+                schemes_by_id = self._schemes_by_id
 
                 # Strong substring check against canonical Tamil names.
-                for sid, ta_name in TA_SCHEME_NAMES.items():
-                    target = _norm(ta_name)
-                    if not target:
-                        continue
+                for sid, target in _ta_names_norm().items():
                     if q_ta in target or target in q_ta:
                         picked = schemes_by_id.get(sid)
                         if picked is not None:
                             return picked
 
                 # Fuzzy match against canonical Tamil names.
-                ta_candidates: List[Tuple[float, str]] = []
-                for sid, ta_name in TA_SCHEME_NAMES.items():
-                    target = _norm(ta_name)
-                    if not target:
-                        continue
-                    ratio = difflib.SequenceMatcher(None, q_ta, target).ratio()
-                    ta_candidates.append((ratio, sid))
-
-                ta_candidates.sort(key=lambda x: x[0], reverse=True)
-                if ta_candidates and ta_candidates[0][0] >= 0.62:
-                    best_sid = ta_candidates[0][1]
-                    picked = schemes_by_id.get(best_sid)
-                    if picked is not None:
-                        return picked
-
-        # Try strong substring matches on common name fields
-        for s in schemes:
-            name = _norm(str(s.get("name", "")))
-            name_en = _norm(str(s.get("name_en", "")))
-            sid = _norm(str(s.get("id", "")))
+                if _rf_process is not None:
+                    match = _rf_process.extractOne(
+                        q_ta, _ta_names_norm(),
+                        scorer=_rf_fuzz.ratio, score_cutoff=62
+                    )
+                    if match is not None:
+                        picked = schemes_by_id.get(match[2])
+                        if picked is not None:
+                            return picked
+                else:
+                    ta_candidates: List[Tuple[float, str]] = []
+                    for sid, target in _ta_names_norm().items():
+                        ratio = difflib.SequenceMatcher(None, q_ta, target).ratio()
+                        ta_candidates.append((ratio, sid))
+
+                    ta_candidates.sort(key=lambda x: x[0], reverse=True)
+                    if ta_candidates and ta_candidates[0][0] >= 0.62:
+                        best_sid = ta_candidates[0][1]
+                        picked = schemes_by_id.get(best_sid)
+                        if picked is not None:
+                            return picked
+
+        # Try strong substring matches on common name fields. A query of
+        # three or more characters can only be a substring of a field
+        # that contains every one of its trigrams, so intersect the
+        # posting sets first and verify only the surviving rows.
+        index = self._scheme_index
+        if len(q) >= 3:
+            candidates: Optional[Set[int]] = None
+            for j in range(len(q) - 2):
+                postings = self._trigram_index.get(q[j:j + 3])
+                if not postings:
+                    candidates = None
+                    break
+                candidates = postings if candidates is None else candidates & postings
+            rows = [index[i] for i in sorted(candidates)] if candidates else []
+        else:
+            rows = index
+        for _sid, name, name_en, sid_n, _hay, sch in rows:
             # If the user's query appears inside any identifier/name, treat as a match.
             if name and q in name:
-                return s
+                return sch
             if name_en and q in name_en:
-                return s
-            if sid and q in sid:
-                return s
+                return sch
+            if sid_n and q in sid_n:
+                return sch
 
         # If the input looks like a scheme query, do a fuzzy match
-        if not _looks_like_scheme_query(text):
+        if not _looks_like_scheme_query(text, norm=q):
+            return None
+
+        if not self._fuzzy_choices:
+            return None
+
+        if _rf_process is not None:
+            match = _rf_process.extractOne(
+                q, self._fuzzy_choices,
+                scorer=_rf_fuzz.ratio, score_cutoff=45
+            )
+            if match is not None:
+                return self._fuzzy_schemes[match[2]]
             return None
 
         candidates: List[Tuple[float, Dict[str, Any]]] = []
-        for s in schemes:
-            hay = " ".join([
-                _norm(str(s.get("name", ""))),
-                _norm(str(s.get("name_en", ""))),
-                _norm(str(s.get("id", ""))),
-            ]).strip()
-            if not hay:
-                continue
+        for hay, sch in zip(self._fuzzy_choices, self._fuzzy_schemes):
             ratio = difflib.SequenceMatcher(None, q, hay).ratio()
-            candidates.append((ratio, s))
+            candidates.append((ratio, sch))
 
         candidates.sort(key=lambda x: x[0], reverse=True)
         if candidates and candidates[0][0] >= 0.45:
@@ -641,6 +939,12 @@ class SimpleSchemeAssistant:
         if not scheme_id:
             return scheme
 
+        cached = self._enrich_cache.get(scheme_id)
+        if cached is not None:
+            # Shallow copy so checklist state hung off the session can't
+            # leak back into the cache.
+            return dict(cached)
+
         enriched = dict(scheme)
 
         try:
@@ -658,42 +962,29 @@ class SimpleSchemeAssistant:
                 if isinstance(proc, dict) and proc.get("website") and not enriched.get("website"):
                     enriched["website"] = proc.get("website")
         except Exception:
+            # Partial enrichment: don't cache, a later attempt may do better.
             return enriched
 
-        return enriched
+        self._enrich_cache[scheme_id] = enriched
+        return dict(enriched)
 
     def _format_suggestions(self, schemes: List[Dict[str, Any]], category: Optional[str]) -> str:
         lang = self.session.language
-        lines: List[str] = []
-        lines.append("தொடர்புடைய திட்டங்கள்:" if lang == "tamil" else "Relevant schemes I found:")
-        for s in schemes:
-            name = _scheme_display_name(s, lang)
-            lines.append(f"- {name}")
-
+        key = _lang_key(lang)
+        body = "\n".join(f"- {_scheme_display_name(s, lang)}" for s in schemes)
         # Ask exactly one short question
-        if category:
-            lines.append(
-                "\nஒரு திட்டத்தின் பெயரை பேசிச் சொல்லுங்கள்; அதன் விவரம் + ஆவண சரிபார்ப்பு + விண்ணப்பிப்பு படிகள் தருகிறேன்."
-                if lang == "tamil"
-                else "\nSay the scheme name to get details + requirements check + apply steps."
-            )
-        else:
-            lines.append(
-                "\nஎந்த வகை திட்டம் வேண்டும்? வீடு / விவசாயம் / சுகாதாரம் / கல்வி / ஓய்வூதியம்"
-                if lang == "tamil"
-                else "\nWhich category do you need? housing / agriculture / health / education / pension"
-            )
-        return "\n".join(lines)
+        footer = _SUGGEST_FOOTER_CAT[key] if category else _SUGGEST_FOOTER_NOCAT[key]
+        return f"{_SUGGEST_HEADER[key]}\n{body}\n{footer}"
 
     def _format_scheme_intro(self, scheme: Dict[str, Any]) -> str:
         """Intro shown immediately after scheme detection (NO apply steps yet)."""
         lang = self.session.language
+        key = _lang_key(lang)
         name = _scheme_display_name(scheme, lang)
         benefits_raw = scheme.get("benefits") or []
         website = scheme.get("website")
 
-        lines: List[str] = []
-        lines.append(f"திட்டம்: {name}" if lang == "tamil" else f"Scheme: {name}")
+        lines: List[str] = [_SCHEME_TITLE[key] % name]
 
         benefits = []
         for b in benefits_raw:
@@ -702,16 +993,11 @@ class SimpleSchemeAssistant:
                 benefits.append(tb)
 
         if benefits:
-            lines.append("\nபயன்கள்:" if lang == "tamil" else "\nBenefits:")
-            for b in benefits[:2]:
-                lines.append(f"- {b}")
+            lines.append(_BENEFITS_HEADER[key])
+            lines.extend(f"- {b}" for b in benefits[:2])
         if website:
-            lines.append(f"\nஅதிகாரப்பூர்வ இணையதளம்: {website}" if lang == "tamil" else f"\nOfficial site: {website}")
-        lines.append(
-            "\nதேவையான ஆவணங்களை பற்றி சில ஆம்/இல்லை கேள்விகள் கேட்கிறேன். பின்னர் விண்ணப்பிக்கும் படிகள் தருகிறேன்."
-            if lang == "tamil"
-            else "\nI will ask a few Yes/No questions about required documents. After that, I will give the steps to apply."
-        )
+            lines.append(_WEBSITE_LINE[key] % website)
+        lines.append(_INTRO_TRAILER[key])
         return "\n".join(lines)
 
     def _format_apply_steps_after_requirements(self, scheme: Dict[str, Any]) -> str:
@@ -2,9 +2,12 @@
 Eligibility Engine Tool
 Checks user eligibility for various government schemes
 """
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, FrozenSet, List, Optional
+from collections import namedtuple
 from datetime import datetime
 
+import numpy as np
+
 from ..agent.core import BaseTool
 
 
@@ -151,109 +154,104 @@ Eligibility checking tool - checks user eligibility for government schemes based
     def _check_scheme_eligibility(self, 
                                   scheme: Dict[str, Any], 
                                   profile: 'UserProfile') -> Dict[str, Any]:
-        """Check if user is eligible for a specific scheme"""
-        criteria = scheme.get("eligibility_criteria", {})
+        """Check if user is eligible for a specific scheme.
+
+        Reads the criteria from the precompiled column table instead of
+        walking the scheme's nested dict; schemes outside the static
+        dataset are compiled on the fly.
+        """
+        table = _SCHEME_TABLE
+        row = table.row_by_id.get(scheme.get("id"))
+        if row is None:
+            table = _compile_schemes([scheme])
+            row = 0
+
         matched = []
         failed = []
         missing = []
         
         # Check age criteria
-        if "min_age" in criteria or "max_age" in criteria:
+        if table.has_age[row]:
             if profile.age is None:
                 missing.append("age")
+            elif table.min_age[row] <= profile.age <= table.max_age[row]:
+                matched.append("age")
             else:
-                min_age = criteria.get("min_age", 0)
-                max_age = criteria.get("max_age", 150)
-                if min_age <= profile.age <= max_age:
-                    matched.append("age")
-                else:
-                    failed.append(f"वय {min_age}-{max_age} वर्षे असणे आवश्यक")
+                failed.append(table.age_fail[row])
         
         # Check income criteria
-        if "max_income" in criteria:
+        if table.has_income[row]:
             if profile.income is None:
                 missing.append("income")
+            elif profile.income <= table.max_income[row]:
+                matched.append("income")
             else:
-                if profile.income <= criteria["max_income"]:
-                    matched.append("income")
-                else:
-                    failed.append(f"उत्पन्न ₹{criteria['max_income']} पेक्षा कमी असणे आवश्यक")
+                failed.append(table.income_fail[row])
         
         # Check gender criteria
-        if "gender" in criteria:
+        genders = table.genders[row]
+        if genders is not None:
             if profile.gender is None:
                 missing.append("gender")
+            elif profile.gender in genders:
+                matched.append("gender")
             else:
-                if profile.gender in criteria["gender"]:
-                    matched.append("gender")
-                else:
-                    failed.append(f"फक्त {', '.join(criteria['gender'])} साठी")
+                failed.append(table.gender_fail[row])
         
         # Check caste category
-        if "caste_categories" in criteria:
+        castes = table.castes[row]
+        if castes is not None:
             if profile.caste_category is None:
                 missing.append("caste_category")
+            elif profile.caste_category in castes:
+                matched.append("caste_category")
             else:
-                if profile.caste_category in criteria["caste_categories"]:
-                    matched.append("caste_category")
-                else:
-                    failed.append(f"फक्त {', '.join(criteria['caste_categories'])} वर्गासाठी")
+                failed.append(table.caste_fail[row])
         
         # Check state
-        if "states" in criteria:
+        states = table.states[row]
+        if states is not None:
             if profile.state is None:
                 missing.append("state")
+            elif profile.state.lower() in states:
+                matched.append("state")
             else:
-                if profile.state.lower() in [s.lower() for s in criteria["states"]]:
-                    matched.append("state")
-                else:
-                    failed.append(f"फक्त {', '.join(criteria['states'])} राज्यांसाठी")
-        
-        # Check farmer status
-        if criteria.get("is_farmer") == True:
-            if profile.is_farmer is None:
-                missing.append("is_farmer")
-            elif not profile.is_farmer:
-                failed.append("फक्त शेतकऱ्यांसाठी")
-            else:
-                matched.append("is_farmer")
+                failed.append(table.state_fail[row])
         
-        # Check BPL status
-        if criteria.get("is_bpl") == True:
-            if profile.is_bpl is None:
-                missing.append("is_bpl")
-            elif not profile.is_bpl:
-                failed.append("फक्त BPL कुटुंबांसाठी")
-            else:
-                matched.append("is_bpl")
+        # Check farmer/BPL status
+        for need, value, field, reason in (
+            (table.need_farmer[row], profile.is_farmer, "is_farmer", "फक्त शेतकऱ्यांसाठी"),
+            (table.need_bpl[row], profile.is_bpl, "is_bpl", "फक्त BPL कुटुंबांसाठी"),
+        ):
+            if need:
+                if value is None:
+                    missing.append(field)
+                elif not value:
+                    failed.append(reason)
+                else:
+                    matched.append(field)
         
         # Check land ownership
-        if "max_land_size" in criteria:
+        if table.has_land[row]:
             if profile.has_land is None or profile.land_size is None:
                 missing.append("land_size")
+            elif profile.land_size <= table.max_land[row]:
+                matched.append("land_size")
             else:
-                if profile.land_size <= criteria["max_land_size"]:
-                    matched.append("land_size")
-                else:
-                    failed.append(f"जमीन {criteria['max_land_size']} एकर पेक्षा कमी असणे आवश्यक")
+                failed.append(table.land_fail[row])
         
-        # Check widow status
-        if criteria.get("is_widow") == True:
-            if profile.is_widow is None:
-                missing.append("is_widow")
-            elif not profile.is_widow:
-                failed.append("फक्त विधवांसाठी")
-            else:
-                matched.append("is_widow")
-        
-        # Check disability
-        if criteria.get("is_disabled") == True:
-            if profile.is_disabled is None:
-                missing.append("is_disabled")
-            elif not profile.is_disabled:
-                failed.append("फक्त अपंग व्यक्तींसाठी")
-            else:
-                matched.append("is_disabled")
+        # Check widow status / disability
+        for need, value, field, reason in (
+            (table.need_widow[row], profile.is_widow, "is_widow", "फक्त विधवांसाठी"),
+            (table.need_disabled[row], profile.is_disabled, "is_disabled", "फक्त अपंग व्यक्तींसाठी"),
+        ):
+            if need:
+                if value is None:
+                    missing.append(field)
+                elif not value:
+                    failed.append(reason)
+                else:
+                    matched.append(field)
         
         # Determine result
         if failed:
@@ -270,7 +268,7 @@ Eligibility checking tool - checks user eligibility for government schemes based
             }
         else:
             # Calculate match score
-            total_criteria = len(criteria)
+            total_criteria = int(table.criteria_count[row])
             match_score = len(matched) / max(total_criteria, 1)
             
             return {
@@ -585,3 +583,94 @@ GOVERNMENT_SCHEMES = [
         "website": "https://sjsa.maharashtra.gov.in"
     }
 ]
+
+
+# Criteria compiled column-wise (structure-of-arrays): numeric bounds in
+# typed NumPy arrays, presence/requirement flags in uint8 masks, and the
+# localized failure messages - which depend only on the criteria values -
+# rendered once here instead of on every check.
+_SchemeTable = namedtuple("_SchemeTable", [
+    "row_by_id",
+    "has_age", "min_age", "max_age", "age_fail",
+    "has_income", "max_income", "income_fail",
+    "genders", "gender_fail",
+    "castes", "caste_fail",
+    "states", "state_fail",
+    "need_farmer", "need_bpl", "need_widow", "need_disabled",
+    "has_land", "max_land", "land_fail",
+    "criteria_count",
+])
+
+
+def _compile_schemes(schemes: List[Dict[str, Any]]) -> _SchemeTable:
+    """Flatten eligibility_criteria dicts into parallel typed columns"""
+    n = len(schemes)
+    has_age = np.zeros(n, dtype=np.uint8)
+    min_age = np.zeros(n, dtype=np.int16)
+    max_age = np.full(n, 150, dtype=np.int16)
+    age_fail: List[str] = [""] * n
+    has_income = np.zeros(n, dtype=np.uint8)
+    max_income = np.zeros(n, dtype=np.float32)
+    income_fail: List[str] = [""] * n
+    genders: List[Optional[List[str]]] = [None] * n
+    gender_fail: List[str] = [""] * n
+    castes: List[Optional[List[str]]] = [None] * n
+    caste_fail: List[str] = [""] * n
+    states: List[Optional[FrozenSet[str]]] = [None] * n
+    state_fail: List[str] = [""] * n
+    need_farmer = np.zeros(n, dtype=np.uint8)
+    need_bpl = np.zeros(n, dtype=np.uint8)
+    need_widow = np.zeros(n, dtype=np.uint8)
+    need_disabled = np.zeros(n, dtype=np.uint8)
+    has_land = np.zeros(n, dtype=np.uint8)
+    max_land = np.zeros(n, dtype=np.float32)
+    land_fail: List[str] = [""] * n
+    criteria_count = np.zeros(n, dtype=np.int16)
+    
+    for i, scheme in enumerate(schemes):
+        criteria = scheme.get("eligibility_criteria", {})
+        if "min_age" in criteria or "max_age" in criteria:
+            has_age[i] = 1
+            lo = criteria.get("min_age", 0)
+            hi = criteria.get("max_age", 150)
+            min_age[i] = lo
+            max_age[i] = hi
+            age_fail[i] = f"वय {lo}-{hi} वर्षे असणे आवश्यक"
+        if "max_income" in criteria:
+            has_income[i] = 1
+            max_income[i] = criteria["max_income"]
+            income_fail[i] = f"उत्पन्न ₹{criteria['max_income']} पेक्षा कमी असणे आवश्यक"
+        if "gender" in criteria:
+            genders[i] = list(criteria["gender"])
+            gender_fail[i] = f"फक्त {', '.join(criteria['gender'])} साठी"
+        if "caste_categories" in criteria:
+            castes[i] = list(criteria["caste_categories"])
+            caste_fail[i] = f"फक्त {', '.join(criteria['caste_categories'])} वर्गासाठी"
+        if "states" in criteria:
+            states[i] = frozenset(st.lower() for st in criteria["states"])
+            state_fail[i] = f"फक्त {', '.join(criteria['states'])} राज्यांसाठी"
+        need_farmer[i] = criteria.get("is_farmer") == True
+        need_bpl[i] = criteria.get("is_bpl") == True
+        need_widow[i] = criteria.get("is_widow") == True
+        need_disabled[i] = criteria.get("is_disabled") == True
+        if "max_land_size" in criteria:
+            has_land[i] = 1
+            max_land[i] = criteria["max_land_size"]
+            land_fail[i] = f"जमीन {criteria['max_land_size']} एकर पेक्षा कमी असणे आवश्यक"
+        criteria_count[i] = len(criteria)
+    
+    return _SchemeTable(
+        row_by_id={s.get("id"): i for i, s in enumerate(schemes)},
+        has_age=has_age, min_age=min_age, max_age=max_age, age_fail=age_fail,
+        has_income=has_income, max_income=max_income, income_fail=income_fail,
+        genders=genders, gender_fail=gender_fail,
+        castes=castes, caste_fail=caste_fail,
+        states=states, state_fail=state_fail,
+        need_farmer=need_farmer, need_bpl=need_bpl,
+        need_widow=need_widow, need_disabled=need_disabled,
+        has_land=has_land, max_land=max_land, land_fail=land_fail,
+        criteria_count=criteria_count,
+    )
+
+
+_SCHEME_TABLE = _compile_schemes(GOVERNMENT_SCHEMES)
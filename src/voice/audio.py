@@ -8,7 +8,7 @@ import threading
 import wave
 import io
 import tempfile
-from typing import Optional, Callable, Generator
+from typing import AsyncIterator, Optional, Callable, Generator
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -107,30 +107,54 @@ class AudioRecorder:
     
     def _to_wav_bytes(self, audio_data: np.ndarray) -> bytes:
         """Convert numpy array to WAV bytes"""
+        return self._pcm_to_wav_bytes(audio_data.tobytes())
+
+    def _pcm_to_wav_bytes(self, pcm_data: bytes) -> bytes:
+        """Wrap raw 16-bit PCM bytes in a WAV container"""
         buffer = io.BytesIO()
-        
+
         with wave.open(buffer, "wb") as wav_file:
             wav_file.setnchannels(self.config.channels)
             wav_file.setsampwidth(2)  # 16-bit
             wav_file.setframerate(self.config.sample_rate)
-            wav_file.writeframes(audio_data.tobytes())
-        
+            wav_file.writeframes(pcm_data)
+
         buffer.seek(0)
         return buffer.read()
-    
-    async def record_with_vad(self, 
+
+    async def record_with_vad(self,
                              on_speech_start: Optional[Callable] = None,
                              on_speech_end: Optional[Callable] = None) -> bytes:
         """
         Record with Voice Activity Detection
         Automatically stops when silence is detected
         """
+        chunks = [
+            chunk async for chunk in self.record_with_vad_stream(
+                on_speech_start=on_speech_start,
+                on_speech_end=on_speech_end
+            )
+        ]
+
+        if not chunks:
+            return b""
+
+        return self._pcm_to_wav_bytes(b"".join(chunks))
+
+    async def record_with_vad_stream(self,
+                                     on_speech_start: Optional[Callable] = None,
+                                     on_speech_end: Optional[Callable] = None) -> AsyncIterator[bytes]:
+        """
+        Record with Voice Activity Detection, yielding raw PCM chunks as
+        they are captured. Streaming-capable STT backends can start
+        decoding while the user is still speaking instead of waiting for
+        the full utterance.
+        """
         try:
             import sounddevice as sd
         except ImportError:
             raise RuntimeError("sounddevice not installed")
-        
-        frames = []
+
         silence_frames = 0
         speech_started = False
         max_frames = int(self.config.max_duration * self.config.sample_rate / self.config.chunk_size)
@@ -140,10 +164,10 @@ class AudioRecorder:
         
         def process_frame(indata):
             nonlocal silence_frames, speech_started
-            
+
             # Calculate RMS energy
             rms = np.sqrt(np.mean(indata ** 2))
-            
+
             if rms > self.config.silence_threshold:
                 if not speech_started:
                     speech_started = True
@@ -160,8 +184,12 @@ class AudioRecorder:
                         return False  # Stop recording
                 return True  # Keep recording
         
-        # Recording loop
-        with sd.InputStream(
+        # Recording loop. RawInputStream hands back raw sample bytes, so
+        # each frame costs one buffer instead of an ndarray plus a
+        # tobytes() copy; VAD reads the same samples through a
+        # zero-copy frombuffer view.
+        dtype = np.dtype(self.config.format)
+        with sd.RawInputStream(
             samplerate=self.config.sample_rate,
             channels=self.config.channels,
             dtype=self.config.format,
@@ -169,20 +197,16 @@ class AudioRecorder:
         ) as stream:
             frame_count = 0
             while frame_count < max_frames:
-                data, _ = stream.read(self.config.chunk_size)
-                frames.append(data.copy())
-                
+                raw, _ = stream.read(self.config.chunk_size)
+                chunk = bytes(raw)
+                yield chunk
+
+                data = np.frombuffer(chunk, dtype=dtype)
                 if not process_frame(data):
                     break
-                
+
                 frame_count += 1
                 await asyncio.sleep(0)  # Yield to event loop
-        
-        if not frames:
-            return b""
-        
-        audio_data = np.concatenate(frames)
-        return self._to_wav_bytes(audio_data)
     
     def record_seconds(self, duration: float) -> bytes:
         """Record for a fixed number of seconds"""
@@ -207,9 +231,47 @@ class AudioRecorder:
 
 class AudioPlayer:
     """Handles audio playback"""
-    
+
     def __init__(self, sample_rate: int = 16000):
         self.sample_rate = sample_rate
+        self._play_queue: Optional[queue.Queue] = None
+        self._worker: Optional[threading.Thread] = None
+
+    def start_worker(self):
+        """Start a dedicated playback thread fed by a bounded queue.
+
+        Playing on its own thread decouples audio from event-loop jitter
+        (Rich rendering, STT, LLM awaits) that can otherwise cause
+        underruns, and serializes overlapping play requests.
+        """
+        if self._worker is not None and self._worker.is_alive():
+            return
+
+        self._play_queue = queue.Queue(maxsize=16)
+        self._worker = threading.Thread(target=self._playback_loop, daemon=True)
+        self._worker.start()
+
+    def stop_worker(self):
+        """Stop the playback thread after draining queued audio"""
+        if self._worker is not None and self._play_queue is not None:
+            self._play_queue.put(None)
+            self._worker.join(timeout=5)
+        self._worker = None
+        self._play_queue = None
+
+    def _playback_loop(self):
+        assert self._play_queue is not None
+        while True:
+            item = self._play_queue.get()
+            if item is None:
+                break
+            audio_data, format, done = item
+            try:
+                self.play_bytes(audio_data, format)
+            except Exception as e:
+                print(f"Playback error: {e}")
+            finally:
+                done.set()
     
     def play_bytes(self, audio_data: bytes, format: str = "wav"):
         """Play audio from bytes"""
@@ -244,8 +306,20 @@ class AudioPlayer:
             raise RuntimeError("sounddevice not installed")
     
     async def play_bytes_async(self, audio_data: bytes, format: str = "wav"):
-        """Play audio asynchronously"""
+        """Play audio asynchronously.
+
+        Routes through the dedicated playback thread when start_worker()
+        has been called; otherwise falls back to the shared executor.
+        """
         loop = asyncio.get_event_loop()
+
+        play_queue = self._play_queue
+        if play_queue is not None and self._worker is not None and self._worker.is_alive():
+            done = threading.Event()
+            await loop.run_in_executor(None, play_queue.put, (audio_data, format, done))
+            await loop.run_in_executor(None, done.wait)
+            return
+
         await loop.run_in_executor(None, self.play_bytes, audio_data, format)
     
     def play_file(self, file_path: str):
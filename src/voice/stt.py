@@ -8,7 +8,7 @@ import wave
 import asyncio
 import tempfile
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple, Dict, Any, List
+from typing import AsyncIterator, Optional, Tuple, Dict, Any, List
 from pathlib import Path
 import shutil
 import glob
@@ -48,21 +48,60 @@ class STTResult:
 
 class BaseSTT(ABC):
     """Base class for STT implementations"""
-    
+
     @abstractmethod
-    async def transcribe(self, 
-                        audio_data: bytes, 
+    async def transcribe(self,
+                        audio_data: bytes,
                         language: Optional[str] = None) -> STTResult:
         """Transcribe audio data to text"""
         pass
-    
+
     @abstractmethod
-    async def transcribe_file(self, 
-                             file_path: str, 
+    async def transcribe_file(self,
+                             file_path: str,
                              language: Optional[str] = None) -> STTResult:
         """Transcribe audio file to text"""
         pass
-    
+
+    async def warm_up(self):
+        """Load models/clients ahead of the first transcribe call.
+
+        Model loading (e.g. Whisper weights) can take seconds; callers can
+        run this concurrently with recording so the cost hides behind the
+        user speaking instead of delaying the first transcription.
+        """
+        initialize = getattr(self, "_initialize", None)
+        if initialize is not None:
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(None, initialize)
+
+    async def transcribe_stream(self,
+                                chunk_iter: AsyncIterator[bytes],
+                                language: Optional[str] = None,
+                                sample_rate: Optional[int] = None,
+                                channels: int = 1) -> STTResult:
+        """Transcribe raw 16-bit PCM chunks from an async iterator.
+
+        The default buffers the stream and decodes once at the end, which
+        is all the bundled backends support; backends with incremental
+        decoders should override this to process chunks as they arrive.
+        """
+        pcm = bytearray()
+        async for chunk in chunk_iter:
+            pcm += chunk
+
+        if not pcm:
+            return STTResult(text="", confidence=0.0, language=language)
+
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as wav_file:
+            wav_file.setnchannels(channels)
+            wav_file.setsampwidth(2)  # 16-bit
+            wav_file.setframerate(sample_rate or settings.sample_rate)
+            wav_file.writeframes(bytes(pcm))
+
+        return await self.transcribe(buffer.getvalue(), language)
+
     @abstractmethod
     def is_available(self) -> bool:
         """Check if the STT service is available"""
@@ -428,17 +467,30 @@ class STTFactory:
         
         return stt
     
+    # Cached best-available instance; probing backends is expensive and the
+    # answer doesn't change within a process.
+    _best_instance: Optional[BaseSTT] = None
+
     @staticmethod
     def get_best_available() -> BaseSTT:
-        """Get the best available STT backend"""
+        """Get the best available STT backend (cached per process)"""
+        if STTFactory._best_instance is not None:
+            return STTFactory._best_instance
+
         # Priority: Azure > Google > Whisper
+        stt: Optional[BaseSTT] = None
         for backend in ["azure", "google", "whisper"]:
             try:
-                stt = STTFactory.create(backend)
-                if stt.is_available():
-                    return stt
+                candidate = STTFactory.create(backend)
+                if candidate.is_available():
+                    stt = candidate
+                    break
             except:
                 continue
-        
+
         # Final fallback
-        return WhisperSTT()
+        if stt is None:
+            stt = WhisperSTT()
+
+        STTFactory._best_instance = stt
+        return stt
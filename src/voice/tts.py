@@ -4,9 +4,10 @@ Supports multiple TTS backends for Indian languages
 """
 import io
 import asyncio
+import re
 import tempfile
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from typing import AsyncIterator, Optional, Dict, Any
 from pathlib import Path
 import importlib
 
@@ -40,16 +41,38 @@ class TTSResult:
         }
 
 
+# Sentence boundaries for streaming synthesis: Latin terminators plus the
+# Devanagari danda/double danda used in Indic text.
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.?!।॥])\s+")
+
+
 class BaseTTS(ABC):
     """Base class for TTS implementations"""
-    
+
     @abstractmethod
-    async def synthesize(self, 
-                        text: str, 
+    async def synthesize(self,
+                        text: str,
                         language: Optional[str] = None) -> TTSResult:
         """Synthesize text to speech"""
         pass
-    
+
+    async def synthesize_stream(self,
+                                text: str,
+                                language: Optional[str] = None) -> AsyncIterator[TTSResult]:
+        """Yield synthesized audio sentence by sentence.
+
+        Splitting on sentence boundaries lets callers start playback as
+        soon as the first sentence is rendered instead of waiting for the
+        whole utterance. Backends with native streaming can override this;
+        the default synthesizes each sentence through synthesize().
+        """
+        sentences = [s for s in _SENTENCE_SPLIT_RE.split(text) if s.strip()]
+        if len(sentences) <= 1:
+            yield await self.synthesize(text, language)
+            return
+        for sentence in sentences:
+            yield await self.synthesize(sentence, language)
+
     @abstractmethod
     def is_available(self) -> bool:
         """Check if the TTS service is available"""
@@ -334,7 +357,13 @@ class TTSFactory:
         
         return backends[backend]()
     
+    # Cached best-available instance; backend probing reruns imports and
+    # availability checks that don't change within a process.
+    _best_instance: Optional[BaseTTS] = None
+
     @staticmethod
     def get_best_available() -> BaseTTS:
-        """Get the best available TTS with automatic fallback"""
-        return IndianLanguageTTS()
+        """Get the best available TTS with automatic fallback (cached per process)"""
+        if TTSFactory._best_instance is None:
+            TTSFactory._best_instance = IndianLanguageTTS()
+        return TTSFactory._best_instance